@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for integrate_research.py.
+
+  python bench_integrate.py escape     # escape_for_js vs the original replace chain
+  python bench_integrate.py pipeline   # per-phase timings on synthetic pages
+
+The pipeline benchmark clones the companies of index.html into synthetic
+pages of 64, 1k, 10k and 50k companies (unique names and ids) with
+matching research, then times each phase of an integration run. Every
+size runs in a fresh worker process so its peak RSS is its own.
+--save writes the results as a JSON baseline; --baseline compares a run
+against one and fails on regressions. bench_baseline.json is the
+committed baseline:
+
+  python bench_integrate.py pipeline --baseline bench_baseline.json
+"""
+
+import argparse
+import glob
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import co_index
+import co_model
+import co_targets
+import integrate_io
+import integrate_research as ir
+from name_resolver import NameResolver
+
+PIPELINE_SIZES = (64, 1000, 10000, 50000)
+PHASES = ("parse", "match", "resolver", "escape", "serialize", "reparse", "write", "index")
+
+
+def escape_for_js_chained(s):
+    """The original eight-replace escaper, kept as the reference output."""
+    s = s.replace('\\', '\\\\')
+    s = s.replace('"', '\\"')
+    s = s.replace('\u2019', "'")
+    s = s.replace('\u2018', "'")
+    s = s.replace('\u201c', '\\"')
+    s = s.replace('\u201d', '\\"')
+    s = s.replace('\u2014', '--')
+    s = s.replace('\u2013', '-')
+    return s
+
+
+def corpus_strings():
+    """Every headline, source, description and icebreaker we have on disk."""
+    strings = []
+    records = list(ir.iter_research([ir.DEFAULT_RESEARCH]))
+    for pattern in ir.SCRIPT_RESEARCH_GLOBS:
+        for path in sorted(glob.glob(pattern)):
+            records.extend(ir.load_research_file(path)[1])
+    for _, data in records:
+        for item in data["news"] or []:
+            strings.extend((item["h"], item["s"], item["d"]))
+        strings.extend(data["icebreakers"] or [])
+    return strings
+
+
+def best_of(fn, strings, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for s in strings:
+            fn(s)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_escape(args):
+    strings = corpus_strings()
+    mismatches = [s for s in strings if co_targets.escape_for_js(s) != escape_for_js_chained(s)]
+    if mismatches:
+        print(f"FAIL  escape_for_js differs from the reference on {len(mismatches)} strings")
+        return False
+    total = sum(len(s) for s in strings)
+    print(f"Corpus: {len(strings)} strings, {total / 1e6:.2f}M chars (output identical)")
+    baseline = best_of(escape_for_js_chained, strings, args.repeat)
+    current = best_of(co_targets.escape_for_js, strings, args.repeat)
+    for label, t in (("replace chain", baseline), ("escape_for_js", current)):
+        print(f"  {label:<14} {t * 1e3:8.2f} ms  {total / t / 1e6:8.1f} Mchar/s")
+    print(f"  speedup        {baseline / current:8.2f}x")
+    return True
+
+
+# ── Pipeline ──
+
+def synthetic_page(template, size):
+    """Return index.html with its CO array replaced by `size` cloned companies.
+
+    Clones past the first round get a numeric suffix, so every name and id
+    stays unique.
+    """
+    doc = co_model.parse_co(template)
+    objects = []
+    for i in range(size):
+        c = doc.companies[i % len(doc.companies)]
+        round_ = i // len(doc.companies)
+        name = c.name if round_ == 0 else f"{c.name} {round_ + 1}"
+        source = template[c.start:c.end]
+        for key, value in sorted((("id", str(i + 1)), ("name", json.dumps(name))),
+                                 key=lambda kv: -c.fields[kv[0]].value_start):
+            f = c.fields[key]
+            source = source[:f.value_start - c.start] + value + source[f.end - c.start:]
+        objects.append("  " + source)
+    return template[:doc.start + 1] + "\n" + ",\n".join(objects) + "\n" + template[doc.end - 1:]
+
+
+def synthetic_research(page, records):
+    """Research for every company of page, cycling the real records.
+
+    Headlines are tagged with the company's id so each one differs from
+    what the page holds and is rewritten.
+    """
+    research = []
+    for i, c in enumerate(co_model.parse_co(page).companies):
+        _, data = records[i % len(records)]
+        news = [dict(item, h=f"{item['h']} [{c.id}]") for item in data["news"]]
+        research.append((c.name, {"news": news, "icebreakers": data["icebreakers"]}))
+    return research
+
+
+def run_pipeline(size):
+    """Time one integration of a synthetic page; runs in a worker process."""
+    with open(ir.DEFAULT_INPUT, "r", encoding="utf-8") as f:
+        template = f.read()
+    page = synthetic_page(template, size)
+    research = synthetic_research(page, list(ir.iter_research([ir.DEFAULT_RESEARCH])))
+    timings = {}
+
+    def phase(name, fn):
+        start = time.perf_counter()
+        result = fn()
+        timings[name] = time.perf_counter() - start
+        return result
+
+    doc = phase("parse", lambda: co_model.parse_co(page))
+    companies = phase("match", lambda: [doc.by_name.get(name) for name, _ in research])
+    # A run builds the fuzzy resolver only once a name misses, so it is its own phase
+    phase("resolver", lambda: NameResolver(doc.by_name.keys(), fuzzy=True))
+
+    def escape():
+        return [[(key, build(data[key])) for key, build in co_targets.FIELD_BUILDERS]
+                for _, data in research]
+    fields = phase("escape", escape)
+
+    def serialize():
+        for company, pieces_by_key in zip(companies, fields):
+            for key, pieces in pieces_by_key:
+                if not doc.field_equals(company, key, pieces):
+                    co_targets.upsert_field(doc, company, key, pieces)
+        return doc.render()
+    content = phase("serialize", serialize)
+
+    # As HtmlTarget.commit: one parse validates the page and indexes it
+    new_doc = phase("reparse", lambda: co_model.parse_co(content))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "index.html")
+        phase("write", lambda: integrate_io.atomic_write(path, content))
+        phase("index", lambda: co_index.save_index(path, new_doc, co_index.content_hash(content)))
+
+    return {
+        "companies": size,
+        "page_bytes": len(page.encode("utf-8")),
+        "seconds": timings,
+        "total_seconds": sum(timings.values()),
+        # ru_maxrss is in kilobytes on Linux
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Print regressions against a baseline; True if there are none."""
+    ok = True
+    for size, result in results.items():
+        base = baseline.get(size)
+        if base is None:
+            continue
+        checks = [(f"{p} time", result["seconds"][p], base["seconds"].get(p)) for p in PHASES]
+        checks.append(("peak RSS", result["peak_rss_kb"], base.get("peak_rss_kb")))
+        for label, now, then in checks:
+            # Sub-millisecond phases are all noise
+            if then and now > then * (1 + tolerance) and (label == "peak RSS" or now > 1e-3):
+                print(f"REGRESSION  {size} companies: {label} {then:.4g} -> {now:.4g}")
+                ok = False
+    return ok
+
+
+def bench_pipeline(args):
+    results = {}
+    print(f"{'companies':>9}  {'page MB':>8}  " + "".join(f"{p:>10}" for p in PHASES)
+          + f"  {'total':>8}  {'peak RSS':>9}")
+    for size in args.sizes:
+        # A fresh process per size keeps peak RSS from carrying over
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            result = pool.submit(run_pipeline, size).result()
+        results[str(size)] = result
+        print(f"{size:>9}  {result['page_bytes'] / 1e6:>8.2f}  "
+              + "".join(f"{result['seconds'][p] * 1e3:>8.1f}ms" for p in PHASES)
+              + f"  {result['total_seconds']:>7.2f}s  {result['peak_rss_kb'] / 1024:>6.0f} MB")
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Saved baseline to {args.save}")
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if not compare(results, baseline, args.tolerance):
+            return False
+        print(f"No regressions against {args.baseline} (tolerance {args.tolerance:.0%}).")
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks for integrate_research.py.")
+    sub = parser.add_subparsers(dest="bench", required=True)
+    p = sub.add_parser("escape", help="escape_for_js throughput on the research corpus")
+    p.add_argument("--repeat", type=int, default=20, help="runs per variant; best is kept")
+    p.set_defaults(func=bench_escape)
+    p = sub.add_parser("pipeline", help="per-phase timings and peak RSS on synthetic pages")
+    p.add_argument("--sizes", type=int, nargs="+", default=list(PIPELINE_SIZES), metavar="N",
+                   help="companies per synthetic page (default: %(default)s)")
+    p.add_argument("--save", metavar="JSON", help="write the results as a baseline")
+    p.add_argument("--baseline", metavar="JSON", help="compare against a saved baseline")
+    p.add_argument("--tolerance", type=float, default=0.25,
+                   help="allowed slowdown / growth vs the baseline (default: 0.25)")
+    p.set_defaults(func=bench_pipeline)
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
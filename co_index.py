@@ -0,0 +1,158 @@
+"""
+Persistent name -> offset index and research fingerprints for the CO array.
+
+Parsing index.html is the fixed cost of every integrator run. The offsets
+it produces (each company's object span and field spans) are cached in a
+sidecar file keyed by the page's SHA-256, so a run against an unchanged
+page loads them instead of re-parsing. Any change to the page changes the
+hash and forces a rebuild.
+
+JSON datasets get an entries sidecar instead: the INDEX_KEYS scalars
+(id, name, type, priority, phase) of every record, so names can be
+resolved and selections filtered without streaming the whole dataset.
+
+Another sidecar records, per company, the fingerprint of the research
+payload last integrated into that exact page, so unchanged companies can
+be skipped before they are serialized.
+"""
+
+import hashlib
+import json
+import os
+
+import co_model
+import integrate_io
+
+INDEX_VERSION = 1
+CACHE_DIR = ".integrate_cache"
+
+
+def content_hash(text):
+    """SHA-256 hex digest of the page text as UTF-8."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def file_hash(path, chunk_size=1 << 20):
+    """SHA-256 hex digest of a file's bytes, read a chunk at a time."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def cache_path(page_path, suffix):
+    """Return the sidecar path for a page, e.g. .integrate_cache/index.html.index.json."""
+    directory, name = os.path.split(os.path.abspath(page_path))
+    return os.path.join(directory, CACHE_DIR, name + suffix)
+
+
+def index_path(page_path):
+    return cache_path(page_path, ".index.json")
+
+
+def load_index(page_path, digest):
+    """Return the cached index for a page if it matches digest, else None."""
+    try:
+        with open(index_path(page_path), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != INDEX_VERSION or data.get("hash") != digest:
+        return None
+    return data["index"]
+
+
+def save_index(page_path, doc, digest=None):
+    """Write the document's offset index next to the page."""
+    path = index_path(page_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = {
+        "version": INDEX_VERSION,
+        "hash": digest or content_hash(doc.text),
+        "index": doc.to_index(),
+    }
+    integrate_io.atomic_write(path, json.dumps(data, separators=(",", ":")))
+
+
+def load_document(page_path, text, digest=None):
+    """Return a CODocument for text, using the cached index when it is current.
+
+    Documents rebuilt from the cache carry offsets and index scalars only;
+    call co_model.parse_co() when full field values are needed.
+    """
+    digest = digest or content_hash(text)
+    index = load_index(page_path, digest)
+    if index is not None:
+        try:
+            return co_model.CODocument.from_index(text, index)
+        except (ValueError, KeyError, TypeError):
+            pass  # Damaged sidecar: rebuild it from a parse
+    doc = co_model.parse_co(text)
+    try:
+        save_index(page_path, doc, digest)
+    except OSError:
+        pass  # Read-only checkout: the cache is an optimization only
+    return doc
+
+
+def research_fingerprint(data):
+    """Hash of a company's news + icebreakers payload.
+
+    Pages' fingerprint sidecars and the research store both compare these,
+    so it is defined once here.
+    """
+    payload = json.dumps([data["news"], data["icebreakers"]], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def fingerprints_path(page_path):
+    return cache_path(page_path, ".fingerprints.json")
+
+
+def load_fingerprints(page_path, digest):
+    """Return {company name: fingerprint} recorded for this exact page.
+
+    Fingerprints written against a different page hash are discarded: the
+    page was edited since, so none of them can be trusted.
+    """
+    try:
+        with open(fingerprints_path(page_path), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != INDEX_VERSION or data.get("hash") != digest:
+        return {}
+    return data["companies"]
+
+
+def save_fingerprints(page_path, digest, fingerprints):
+    """Record the research fingerprints integrated into the page with digest."""
+    path = fingerprints_path(page_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = {"version": INDEX_VERSION, "hash": digest, "companies": fingerprints}
+    integrate_io.atomic_write(path, json.dumps(data, separators=(",", ":"), sort_keys=True))
+
+
+def entries_path(page_path):
+    return cache_path(page_path, ".entries.json")
+
+
+def load_entries(page_path, digest):
+    """Return the cached INDEX_KEYS entries for a file with digest, else None."""
+    try:
+        with open(entries_path(page_path), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != INDEX_VERSION or data.get("hash") != digest:
+        return None
+    return data["entries"]
+
+
+def save_entries(page_path, digest, entries):
+    """Record the INDEX_KEYS entries of the file with digest."""
+    path = entries_path(page_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = {"version": INDEX_VERSION, "hash": digest, "entries": entries}
+    integrate_io.atomic_write(path, json.dumps(data, separators=(",", ":"), ensure_ascii=False))
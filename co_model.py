@@ -0,0 +1,607 @@
+"""
+Object model for the CO array embedded in index.html.
+
+Parses `const CO = [...]` once into slotted records that remember the
+offsets of every top-level field, so callers can look companies up by
+name and rewrite individual fields without re-scanning the page. Edits
+are collected on the document and applied in a single join, which leaves
+every untouched byte exactly as it was.
+
+With news interning (integrate_research.py --dedup-news) identical news
+items are stored once in a `const NEWS = [...]` table just before the CO
+array, and companies refer to them as NEWS[i]. The parser resolves those
+references, so interned and inline pages yield the same records.
+"""
+
+import json
+import re
+
+CO_ARRAY_MARKER = "const CO = ["
+NEWS_TABLE_MARKER = "const NEWS = ["
+
+# Strings and comments are consumed whole so brackets or `key:` text inside
+# them are never mistaken for structure.
+TOKEN = re.compile(r"""
+      (?P<str>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+    | (?P<comment>//[^\n]*|/\*.*?\*/)
+    | (?P<punct>[\[\]{},:;])
+    | (?P<num>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+    | (?P<ref>NEWS\[\d+\])
+    | (?P<ident>[A-Za-z_$][\w$]*)
+    | (?P<space>\s+)
+    | (?P<bad>.)
+""", re.VERBOSE | re.DOTALL)
+
+JS_ESCAPE = re.compile(r"""\\(?:x([0-9A-Fa-f]{2})|u\{([0-9A-Fa-f]{1,6})\}|u([0-9A-Fa-f]{4})
+                          |(\r\n|[\n\r\u2028\u2029])|(.))""", re.VERBOSE | re.DOTALL)
+SIMPLE_ESCAPES = {"b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v"}
+
+IDENT = re.compile(r"[A-Za-z_$][\w$]*\Z")
+# Scalar fields kept in the offset index so lookups and filters work without a parse
+INDEX_KEYS = ("id", "name", "type", "priority", "phase")
+KEYWORDS = {"true": True, "false": False, "null": None}
+
+
+class COParseError(ValueError):
+    """Raised when the CO array is not a literal this parser understands."""
+
+    def __init__(self, message, offset, company=None, line=None):
+        where = f" in {company}" if company else ""
+        at = f" (line {line})" if line else ""
+        super().__init__(f"{message}{where} at offset {offset}{at}")
+        self.message = message
+        self.offset = offset
+        self.company = company
+        self.line = line
+
+
+def js_string_value(literal, offset=0):
+    """Decode a JS string literal token into a Python string.
+
+    Handles every escape a JS string may use, including the ones JSON lacks
+    (\\', \\xHH, \\v, \\0, \\u{...} and line continuations). Legacy octal
+    escapes raise COParseError at offset, the token's position.
+    """
+    body = literal[1:-1]
+    if "\\" not in body:
+        return body
+
+    def decode(m):
+        hex_byte, code_point, code_unit, continuation, char = m.groups()
+        if continuation is not None:
+            return ""
+        if char is None:
+            return chr(int(hex_byte or code_point or code_unit, 16))
+        if char in SIMPLE_ESCAPES:
+            return SIMPLE_ESCAPES[char]
+        if char == "0" and not body[m.end():m.end() + 1].isdigit():
+            return "\0"
+        if char.isdigit() or char in "xu":
+            raise COParseError(f"unsupported escape {m.group()!r} in string", offset + 1 + m.start())
+        return char
+
+    value = JS_ESCAPE.sub(decode, body)
+    # \uD83D\uDE00 decodes to two surrogates; join them into one character
+    if any("\ud800" <= c <= "\udfff" for c in value):
+        value = value.encode("utf-16", "surrogatepass").decode("utf-16", "replace")
+    return value
+
+
+def js_literal(value):
+    """Serialize a Python value in the CO array's compact literal style."""
+    if isinstance(value, str):
+        return json.dumps(value)
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if value is None:
+        return "null"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(js_literal(v) for v in value) + "]"
+    if hasattr(value, "to_dict"):
+        value = value.to_dict()
+    parts = []
+    for k, v in value.items():
+        key = k if IDENT.match(k) else json.dumps(k)
+        parts.append(key + ":" + js_literal(v))
+    return "{" + ",".join(parts) + "}"
+
+
+# ── Records ──
+
+class Record:
+    """Base for slotted records built from parsed object literals."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, d):
+        rec = cls.__new__(cls)
+        for slot in cls.__slots__:
+            setattr(rec, slot, d.get(slot))
+        return rec
+
+    def to_dict(self):
+        return {s: getattr(self, s) for s in self.__slots__ if getattr(self, s) is not None}
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class Contact(Record):
+    __slots__ = ("n", "t")
+
+
+class NewsItem(Record):
+    __slots__ = ("h", "s", "d")
+
+
+class Leader(Record):
+    __slots__ = ("n", "t", "bg", "hooks", "li")
+
+
+class Field:
+    """Offsets of one top-level `key:value` pair inside a company object."""
+
+    __slots__ = ("key", "start", "value_start", "end")
+
+    def __init__(self, key, start, value_start, end):
+        self.key = key
+        self.start = start
+        self.value_start = value_start
+        self.end = end
+
+
+class Company:
+    """One object of the CO array plus the offsets it was parsed from."""
+
+    __slots__ = ("id", "name", "type", "priority", "phase", "booth", "clear",
+                 "contacts", "desc", "notes", "news", "ice", "icebreakers",
+                 "tp", "leaders", "ask", "extra", "start", "end", "fields")
+
+    def __init__(self, values, start, end, fields):
+        for slot in ("id", "name", "type", "priority", "phase", "booth", "clear",
+                     "desc", "notes", "ice", "ask"):
+            setattr(self, slot, values.pop(slot, None))
+        self.contacts = [Contact.from_dict(c) for c in values.pop("contacts", None) or []]
+        self.news = [NewsItem.from_dict(x) for x in values.pop("news", None) or []]
+        self.leaders = [Leader.from_dict(x) for x in values.pop("leaders", None) or []]
+        self.icebreakers = values.pop("icebreakers", None) or []
+        self.tp = values.pop("tp", None) or []
+        self.extra = values
+        self.start = start
+        self.end = end
+        self.fields = fields
+
+    def to_dict(self):
+        d = {}
+        for key in self.fields:
+            if key in self.extra:
+                d[key] = self.extra[key]
+            else:
+                value = getattr(self, key)
+                d[key] = [v.to_dict() for v in value] if key in ("contacts", "news", "leaders") else value
+        return d
+
+    def __repr__(self):
+        return f"Company(id={self.id!r}, name={self.name!r})"
+
+
+# ── Parser ──
+
+class _Parser:
+    def __init__(self, text, pos, news=None):
+        self.text = text
+        self.news = news
+        self.name = None
+        self.tokens = TOKEN.finditer(text, pos)
+        self.end = pos
+        self.advance()
+
+    def advance(self):
+        self.last_end = self.end
+        for m in self.tokens:
+            kind = m.lastgroup
+            if kind == "space" or kind == "comment":
+                continue
+            if kind == "bad":
+                raise COParseError(f"unexpected character {m.group()!r}", m.start())
+            self.kind, self.tok, self.pos, self.end = kind, m.group(), m.start(), m.end()
+            return
+        self.kind, self.tok, self.pos, self.end = "eof", "", len(self.text), len(self.text)
+
+    def expect(self, tok):
+        if self.tok != tok:
+            raise COParseError(f"expected {tok!r}, found {self.tok or 'end of input'!r}", self.pos)
+        end = self.end
+        self.advance()
+        return end
+
+    def key(self):
+        if self.kind == "ident":
+            key = self.tok
+        elif self.kind == "str":
+            key = js_string_value(self.tok, self.pos)
+        else:
+            raise COParseError(f"expected object key, found {self.tok!r}", self.pos)
+        self.advance()
+        self.expect(":")
+        return key
+
+    def value(self):
+        kind, tok, pos = self.kind, self.tok, self.pos
+        if tok == "{":
+            self.advance()
+            obj = {}
+            while self.tok != "}":
+                key = self.key()
+                obj[key] = self.value()
+                if self.tok != ",":
+                    break
+                self.advance()
+            self.expect("}")
+            return obj
+        if tok == "[":
+            self.advance()
+            arr = []
+            while self.tok != "]":
+                arr.append(self.value())
+                if self.tok != ",":
+                    break
+                self.advance()
+            self.expect("]")
+            return arr
+        self.advance()
+        if kind == "str":
+            return js_string_value(tok, pos)
+        if kind == "num":
+            return float(tok) if any(c in tok for c in ".eE") else int(tok)
+        if kind == "ident" and tok in KEYWORDS:
+            return KEYWORDS[tok]
+        if kind == "ref":
+            i = int(tok[5:-1])
+            if self.news is None or i >= len(self.news):
+                raise COParseError(f"unknown news reference {tok}", pos)
+            return self.news[i]
+        raise COParseError(f"unexpected token {tok!r}", pos)
+
+    def company(self):
+        start = self.pos
+        self.name = None
+        self.expect("{")
+        values = {}
+        fields = {}
+        while self.tok != "}":
+            key_start = self.pos
+            key = self.key()
+            value_start = self.pos
+            values[key] = self.value()
+            if key == "name":
+                self.name = values[key]  # Names the company in parse errors
+            fields[key] = Field(key, key_start, value_start, self.last_end)
+            if self.tok != ",":
+                break
+            self.advance()
+        end = self.expect("}")
+        return Company(values, start, end, fields)
+
+
+class CODocument:
+    """A parsed page: the original text, its companies and pending edits."""
+
+    __slots__ = ("text", "start", "end", "companies", "by_name", "by_id", "_edits")
+
+    def __init__(self, text, start, end, companies):
+        self.text = text
+        self.start = start
+        self.end = end
+        self.companies = companies
+        # First object with a given name/id wins, matching lookup order in the page
+        self.by_name = {}
+        self.by_id = {}
+        for c in companies:
+            self.by_name.setdefault(c.name, c)
+            self.by_id.setdefault(c.id, c)
+        self._edits = []
+
+    def to_index(self):
+        """Return a JSON-serializable offset index of the companies."""
+        return {
+            "start": self.start,
+            "end": self.end,
+            "companies": [
+                dict({k: getattr(c, k) for k in INDEX_KEYS},
+                     start=c.start, end=c.end,
+                     fields={k: [f.start, f.value_start, f.end] for k, f in c.fields.items()})
+                for c in self.companies
+            ],
+        }
+
+    @classmethod
+    def from_index(cls, text, index):
+        """Rebuild a document from to_index() output without parsing.
+
+        Companies carry only the INDEX_KEYS scalars and field offsets; their
+        list fields stay empty. Raises ValueError if the spans are not
+        ordered, disjoint and nested (a damaged index).
+        """
+        companies = []
+        pos = index["start"]
+        for entry in index["companies"]:
+            fields = {k: Field(k, *offsets) for k, offsets in entry["fields"].items()}
+            values = {k: entry[k] for k in INDEX_KEYS}
+            company = Company(values, entry["start"], entry["end"], fields)
+            if company.start < pos or any(not _inside(company, f) for f in fields.values()):
+                raise ValueError(f"index spans for {company.name!r} are out of order")
+            pos = company.end
+            companies.append(company)
+        if pos > index["end"] or index["end"] > len(text):
+            raise ValueError("index spans run past the CO array")
+        return cls(text, index["start"], index["end"], companies)
+
+    def field_text(self, company, key):
+        """Return the raw `key:value` source of a field."""
+        f = company.fields[key]
+        return self.text[f.start:f.end]
+
+    def field_equals(self, company, key, pieces):
+        """True if the field's `key:value` source equals "".join(pieces).
+
+        Compares piece by piece against the page so no joined copy is made.
+        """
+        f = company.fields.get(key)
+        if f is None:
+            return False
+        text = self.text
+        pos = f.start
+        for piece in pieces:
+            if not text.startswith(piece, pos):
+                return False
+            pos += len(piece)
+        return pos == f.end
+
+    def _indent(self, company, field):
+        # Only look back as far as the object's own opening brace
+        newline = self.text.rfind("\n", company.start, field.start)
+        if newline == -1:
+            return None
+        prefix = self.text[newline + 1:field.start]
+        return prefix if not prefix.strip() else None
+
+    # Edits are confined to the company's own object: every offset used is
+    # checked against its span, so a bad lookup can never patch a neighbor.
+    # Fragments may be a string or a list of string pieces; pieces are kept
+    # as they are until render() joins the whole page once.
+
+    def _field(self, company, key):
+        f = company.fields[key]
+        if not _inside(company, f):
+            raise ValueError(f"field {key!r} of {company.name!r} lies outside its object")
+        return f
+
+    def replace_field(self, company, key, fragment):
+        """Replace an existing `key:value` pair with a new fragment."""
+        f = self._field(company, key)
+        self._edits.append((f.start, f.end, _pieces(fragment)))
+
+    def insert_before(self, company, anchor, fragment):
+        """Insert a `key:value` fragment just before the anchor field."""
+        f = self._field(company, anchor)
+        indent = self._indent(company, f)
+        if indent is None:
+            self._edits.append((f.start, f.start, [*_pieces(fragment), ", "]))
+        else:
+            # Own line, same indent, placed before the anchor's newline
+            pos = f.start - len(indent) - 1
+            self._edits.append((pos, pos, ["\n", indent, *_pieces(fragment), ","]))
+
+    def insert_after(self, company, anchor, fragment):
+        """Insert a `key:value` fragment just after the anchor field."""
+        f = self._field(company, anchor)
+        indent = self._indent(company, f)
+        # Keep a single separator whether or not the anchor was the last field
+        trailing = "" if self.text[f.end:company.end].lstrip().startswith(",") else ","
+        sep = ", " if indent is None else ",\n" + indent
+        self._edits.append((f.end, f.end, [sep, *_pieces(fragment), trailing]))
+
+    def replace_span(self, start, end, fragment):
+        """Replace text[start:end] outside the companies, e.g. the NEWS table."""
+        self._edits.append((start, end, _pieces(fragment)))
+
+    def discard_edits(self):
+        self._edits.clear()
+
+    def render(self):
+        """Apply pending edits in one pass and return the new page text.
+
+        Untouched segments are sliced from the original and every fragment
+        piece goes into a single chunk list, joined exactly once.
+        """
+        chunks = []
+        pos = 0
+        for start, end, pieces in sorted(self._edits, key=lambda e: e[0]):
+            if start < pos:
+                raise ValueError(f"overlapping edits at offset {start}")
+            chunks.append(self.text[pos:start])
+            chunks.extend(pieces)
+            pos = end
+        chunks.append(self.text[pos:])
+        return "".join(chunks)
+
+
+def _inside(company, field):
+    """True if the field's span lies strictly inside the company's braces."""
+    return company.start < field.start <= field.value_start <= field.end < company.end
+
+
+def _pieces(fragment):
+    return [fragment] if isinstance(fragment, str) else fragment
+
+
+class NewsTable:
+    """The interned `const NEWS = [...];` statement: its span and items."""
+
+    __slots__ = ("start", "end", "items")
+
+    def __init__(self, start, end, items):
+        self.start = start
+        self.end = end
+        self.items = items
+
+
+def parse_news_table(text):
+    """Return the page's NewsTable, or None if its news is not interned.
+
+    The span runs from `const` through the `;` and its newline.
+    """
+    marker = text.find(NEWS_TABLE_MARKER)
+    if marker == -1:
+        return None
+    p = _Parser(text, marker + len(NEWS_TABLE_MARKER) - 1)
+    items = p.value()
+    if p.tok != ";":
+        raise COParseError(f"expected ';' after the NEWS table, found {p.tok or 'end of input'!r}", p.pos)
+    if not all(isinstance(item, dict) for item in items):
+        raise COParseError("NEWS table entries must be objects", marker)
+    end = p.end + (text.startswith("\n", p.end))
+    return NewsTable(marker, end, items)
+
+
+def parse_co(text):
+    """Parse the CO array in a page and return a CODocument.
+
+    Raises COParseError naming the company being read and the offset and
+    line of the first problem, so a parse doubles as validation.
+    """
+    marker = text.find(CO_ARRAY_MARKER)
+    if marker == -1:
+        raise COParseError("CO array not found", 0)
+    start = marker + len(CO_ARRAY_MARKER) - 1
+    table = parse_news_table(text)
+    p = _Parser(text, start, table.items if table else None)
+    companies = []
+    try:
+        p.expect("[")
+        while p.tok != "]":
+            try:
+                companies.append(p.company())
+            except COParseError as e:
+                raise COParseError(e.message, e.offset, _company_label(len(companies) + 1, p.name),
+                                   _line(text, e.offset)) from None
+            if p.tok != ",":
+                break
+            p.advance()
+        if p.tok != "]":
+            raise COParseError(f"expected ',' or ']', found {p.tok or 'end of input'!r}", p.pos)
+    except COParseError as e:
+        if e.line is None:
+            raise COParseError(e.message, e.offset, line=_line(text, e.offset)) from None
+        raise
+    return CODocument(text, start, p.end, companies)
+
+
+def _company_label(index, name):
+    return f"company #{index}" + (f" {name!r}" if name else "")
+
+
+def _line(text, pos):
+    return text.count("\n", 0, pos) + 1
+
+
+# ── Validation ──
+
+_VALUE_START = frozenset(("str", "num", "ident", "ref", "{", "["))
+
+
+def validate_co(text):
+    """Check the CO array's literal structure in one linear token pass.
+
+    Only the CO array is tokenized, with strings and comments consumed
+    whole, so brackets inside text never count. Raises COParseError naming
+    the company being read and the offset (and line) of the first problem.
+    """
+    marker = text.find(CO_ARRAY_MARKER)
+    if marker == -1:
+        raise COParseError("CO array not found", 0)
+    table = parse_news_table(text)
+    news_count = len(table.items) if table else 0
+    # Each stack entry is the container ("{" or "[") and what it expects next:
+    # "key", ":", "value" or "sep" (a comma or the closing bracket).
+    stack = []
+    expect = "value"
+    company = None          # (index, name) of the top-level object being read
+    index = 0
+    last_key = None
+
+    def fail(message, pos):
+        label = _company_label(*company) if company is not None else None
+        raise COParseError(message, pos, label, _line(text, pos))
+
+    for m in TOKEN.finditer(text, marker + len(CO_ARRAY_MARKER) - 1):
+        kind = m.lastgroup
+        if kind == "space" or kind == "comment":
+            continue
+        tok = m.group()
+        pos = m.start()
+        if kind == "bad":
+            fail("unterminated string" if tok in "\"'" else f"unexpected character {tok!r}", pos)
+        kind = tok if kind == "punct" else kind
+        container = stack[-1] if stack else None
+
+        if expect == "key":
+            if kind == "}":
+                expect = None
+            elif kind in ("ident", "str"):
+                last_key = tok
+                expect = ":"
+                continue
+            else:
+                fail(f"expected a key, found {tok!r}", pos)
+        elif expect == ":":
+            if kind != ":":
+                fail(f"expected ':' after {last_key}, found {tok!r}", pos)
+            expect = "value"
+            continue
+        elif expect == "value":
+            if kind not in _VALUE_START and not (container == "[" and kind == "]"):
+                fail(f"expected a value, found {tok!r}", pos)
+            if kind == "ident" and tok not in KEYWORDS:
+                fail(f"unknown identifier {tok!r}", pos)
+            if kind == "ref" and int(tok[5:-1]) >= news_count:
+                fail(f"unknown news reference {tok}", pos)
+            if kind == "str" and container == "{" and last_key == "name" and len(stack) == 2:
+                try:
+                    company = (company[0], js_string_value(tok, pos))
+                except COParseError as e:
+                    fail(e.message, e.offset)
+        elif expect == "sep":
+            if kind == ",":
+                expect = "key" if container == "{" else "value"
+                continue
+            closer = "}" if container == "{" else "]"
+            if kind != closer:
+                fail(f"expected ',' or {closer!r}, found {tok!r}", pos)
+
+        # Open or close containers; anything else was a scalar value
+        if kind in ("{", "["):
+            stack.append(kind)
+            if kind == "{" and len(stack) == 2:
+                index += 1
+                company = (index, None)
+            expect = "key" if kind == "{" else "value"
+            last_key = None
+        elif kind in ("}", "]"):
+            if not stack or (kind == "}") != (stack[-1] == "{"):
+                fail(f"unbalanced {tok!r}", pos)
+            stack.pop()
+            if not stack:
+                return
+            if len(stack) == 1:
+                company = None
+            expect = "sep"
+        else:
+            expect = "sep"
+    fail("CO array is not closed", len(text))
@@ -0,0 +1,703 @@
+"""
+Target adapters for integrate_research.py.
+
+Research is read once and fanned out to every target. Each adapter knows
+how to find a company in its file, decide whether the research changes
+it, and write the result back:
+
+  HtmlTarget   index.html, the CO array embedded as a JS literal
+  JsonTarget   eventiq JSON datasets (companies.json, all-companies.json)
+
+Research names are resolved against each target's own names (exact,
+alias, normalized, optionally fuzzy; see name_resolver.py). Adapters
+record a status per company (OK, SAME, SKIP, FAIL) and print a report
+when committed.
+"""
+
+import hashlib
+import json
+import os
+
+import co_index
+import co_model
+import integrate_io
+import integrate_metrics
+import page_artifacts
+from name_resolver import NameResolver
+
+
+# (old, new) pairs applied by escape_for_js. Backslash must come first so
+# the escapes added for quotes are not escaped again.
+JS_ESCAPES = (
+    ('\\', '\\\\'),
+    ('"', '\\"'),
+    # Convert smart quotes / em dashes to safe ASCII
+    ('\u2019', "'"),     # right single quote
+    ('\u2018', "'"),     # left single quote
+    ('\u201c', '\\"'),   # left double quote
+    ('\u201d', '\\"'),   # right double quote
+    ('\u2014', '--'),    # em dash
+    ('\u2013', '-'),     # en dash
+)
+
+
+def escape_for_js(s):
+    """Escape a string for embedding inside JS double-quoted strings."""
+    # Most research text is plain ASCII with no quotes or backslashes: return
+    # it as is instead of copying it once per replacement.
+    if s.isascii():
+        if '"' not in s and '\\' not in s:
+            return s
+        return s.replace('\\', '\\\\').replace('"', '\\"')
+    for old, new in JS_ESCAPES:
+        s = s.replace(old, new)
+    return s
+
+
+def news_chunks(news_items):
+    """Return the news:[...] JS array as a list of string pieces."""
+    out = ["news:["]
+    sep = '{h:"'
+    for item in news_items:
+        out += (sep, escape_for_js(item["h"]), '",s:"', escape_for_js(item["s"]),
+                '",d:"', escape_for_js(item["d"]), '"}')
+        sep = ',{h:"'
+    out.append("]")
+    return out
+
+
+def icebreakers_chunks(icebreakers):
+    """Return the icebreakers:[...] JS array as a list of string pieces."""
+    out = ["icebreakers:["]
+    sep = '"'
+    for ib in icebreakers:
+        out += (sep, escape_for_js(ib), '"')
+        sep = ',"'
+    out.append("]")
+    return out
+
+
+def escape_verbatim(s):
+    """Escape a string for a JS double-quoted string, keeping every character."""
+    return json.dumps(s, ensure_ascii=False)[1:-1]
+
+
+def news_item_literal(item, escape=escape_for_js):
+    """One news item as the page writes it, e.g. {h:"...",s:"...",d:"..."}.
+
+    Research is escaped with escape_for_js; items already on the page use
+    escape_verbatim so moving them into the NEWS table changes no text.
+    """
+    return "{" + ",".join(f'{k}:"{escape(item[k])}"' for k in ("h", "s", "d")
+                          if item.get(k) is not None) + "}"
+
+
+def build_news_string(news_items):
+    """Build the news:[...] JS array string."""
+    return "".join(news_chunks(news_items))
+
+
+def build_icebreakers_string(icebreakers):
+    """Build the icebreakers:[...] JS array string."""
+    return "".join(icebreakers_chunks(icebreakers))
+
+
+# Research fields and how to place them when a company does not have them yet
+FIELD_BUILDERS = (("news", news_chunks), ("icebreakers", icebreakers_chunks))
+INSERT_NEXT_TO_ICE = {"news": co_model.CODocument.insert_before,
+                      "icebreakers": co_model.CODocument.insert_after}
+
+
+def changed_fields(doc, company, data, interned=False):
+    """Return [(key, pieces)] for research fields that differ from the page.
+
+    A field whose research value is None is not part of the update. On an
+    interned page news is compared item by item and returned as the item
+    list, since its pieces depend on the whole NEWS table.
+    """
+    changed = []
+    for key, build in FIELD_BUILDERS:
+        if data[key] is None:
+            continue
+        if interned and key == "news":
+            literals = [news_item_literal(item) for item in data["news"]]
+            if ("news" not in company.fields
+                    or literals != [news_item_literal(n.to_dict(), escape_verbatim)
+                                    for n in company.news]):
+                changed.append((key, data["news"]))
+            continue
+        pieces = build(data[key])
+        if not doc.field_equals(company, key, pieces):
+            changed.append((key, pieces))
+    return changed
+
+
+def upsert_field(doc, company, key, pieces):
+    """Replace key's field in place, or insert it next to ice if missing."""
+    if key in company.fields:
+        doc.replace_field(company, key, pieces)
+    else:
+        INSERT_NEXT_TO_ICE[key](doc, company, "ice", pieces)
+
+
+# ── Selection ──
+
+# Priority tiers as eventiq/scripts/refresh.js and the refresh workflows name them
+PRIORITY_TIERS = {"P0": (1, 2), "P1": (3, 4), "TBC": (5, 6), "NOT PRIORITY": (7,)}
+
+
+class Selection:
+    """Which companies a run may touch, by priority, phase and type.
+
+    Each criterion is a set of allowed values, or None for any; a company
+    must pass all of them.
+    """
+
+    __slots__ = ("priorities", "phases", "types")
+
+    def __init__(self, priorities=None, phases=None, types=None):
+        self.priorities = priorities
+        self.phases = phases
+        self.types = types
+
+    @classmethod
+    def from_args(cls, priorities=(), phases=(), types=()):
+        """Build a selection from CLI values: "P0", "3", "ICP", "all", comma lists."""
+        def values(args):
+            items = [v.strip() for arg in args or () for v in arg.split(",") if v.strip()]
+            return None if not items or any(v.lower() == "all" for v in items) else items
+
+        priority_values = values(priorities)
+        if priority_values is not None:
+            priority_values = {p for v in priority_values
+                               for p in PRIORITY_TIERS.get(v.upper()) or (_int(v, "priority"),)}
+        phase_values = values(phases)
+        if phase_values is not None:
+            phase_values = {_int(v, "phase") for v in phase_values}
+        type_values = values(types)
+        if type_values is not None:
+            type_values = {v.lower() for v in type_values}
+        return cls(priority_values, phase_values, type_values)
+
+    def __bool__(self):
+        return any(v is not None for v in (self.priorities, self.phases, self.types))
+
+    def matches(self, priority, phase, type_):
+        return ((self.priorities is None or priority in self.priorities)
+                and (self.phases is None or phase in self.phases)
+                and (self.types is None or (type_ or "").lower() in self.types))
+
+    def __str__(self):
+        parts = [f"{label} {','.join(str(v) for v in sorted(values))}"
+                 for label, values in (("priority", self.priorities), ("phase", self.phases),
+                                       ("type", self.types)) if values is not None]
+        return "; ".join(parts) or "all"
+
+
+def _int(value, what):
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"bad {what} {value!r}") from None
+
+
+# ── Targets ──
+
+class Target:
+    """Common bookkeeping: fingerprints, per-company results and the report."""
+
+    kind = None
+
+    def __init__(self, path, digest, backups=0, fuzzy=False):
+        self.path = path
+        self.digest = digest
+        self.backups = backups
+        self.fuzzy = fuzzy
+        self.resolver = None
+        # Names the selection allows (None: all) and research left out by it
+        self.selection = None
+        self.scope = None
+        self.excluded = 0
+        self.results = []
+        # Fingerprints of research already integrated into this exact file;
+        # only updated companies change, so earlier ones stay valid
+        self.fingerprints = co_index.load_fingerprints(path, self.digest)
+        # Fingerprints noted in this batch, kept only once it is written
+        self.noted = {}
+        # Pending change per company; a later record for the same company wins
+        self.updates = {}
+        # Target name -> how a differently named research entry was matched
+        self.matches = {}
+        # Who the research being applied came from (None: this run) and, per
+        # research and target name, who sent the latest record for it
+        self.origin = None
+        self.origins = {}
+
+    def reset(self):
+        """Start a new batch against the file as it is now (watch mode)."""
+        self.results = []
+        self.updates = {}
+        self.matches = {}
+        self.origins = {}
+        self.excluded = 0
+        # A batch that failed to write leaves the committed fingerprints as they were
+        self.noted = {}
+
+    def record(self, status, name, detail=None):
+        if status != "OK":
+            self.updates.pop(name, None)
+        detail = detail or self.matches.get(name)
+        self.results.append((status, name, detail))
+        return status
+
+    def names(self):
+        """Set of company names in the target."""
+        raise NotImplementedError
+
+    def entries(self):
+        """Iterable of {INDEX_KEYS: value} for every company in the target."""
+        raise NotImplementedError
+
+    def select(self, selection):
+        """Restrict the run to companies matching selection, decided up front."""
+        if not selection:
+            return
+        self.selection = selection
+        self.scope = {e["name"] for e in self.entries()
+                      if selection.matches(e["priority"], e["phase"], e["type"])}
+
+    def in_scope(self, name):
+        """True if the selection allows name; counts the research it drops."""
+        if self.scope is None or name in self.scope:
+            return True
+        self.excluded += 1
+        return False
+
+    def resolve(self, name, data):
+        """Return the target's name for a research name, or None.
+
+        Exact names are a set lookup; the resolver index is only built the
+        first time a name misses.
+        """
+        self.origins[name] = self.origin
+        if name in self.names():
+            self.matches.pop(name, None)
+            return name
+        if self.resolver is None:
+            self.resolver = NameResolver(self.names(), fuzzy=self.fuzzy)
+        target_name, how = self.resolver.resolve(name, data.get("aliases", ()))
+        if target_name is not None:
+            self.matches[target_name] = f"research name {name!r} ({how})"
+            self.origins[target_name] = self.origin
+        return target_name
+
+    def seen(self, name, fingerprint):
+        """Note the fingerprint; True if this research is already integrated."""
+        if self.fingerprints.get(name) == fingerprint:
+            return True
+        self.noted[name] = fingerprint
+        return False
+
+    def failed(self):
+        """Names that failed in this run's own research (see results_from())."""
+        return {name for status, name, _ in self.results
+                if status == "FAIL" and self.origins.get(name) is None}
+
+    def results_from(self, origin):
+        """Results of the research applied while self.origin was origin."""
+        return [r for r in self.results if self.origins.get(r[1]) == origin]
+
+    def count(self, status):
+        return sum(1 for r in self.results if r[0] == status)
+
+    def report(self):
+        for status, name, detail in self.results:
+            if status != "SKIP":
+                print(f"  {status}  {name}" + (f" -- {detail}" if detail else ""))
+        counts = (f"{self.count('SAME')} unchanged, {self.count('SKIP')} skipped (fingerprint match), "
+                  f"{self.count('FAIL')} failed.")
+        if self.selection:
+            counts += f" {self.excluded} outside the selection ({self.selection})."
+        if self.count("OK"):
+            print(f"\nDone. {self.count('OK')} updated, {counts}")
+        else:
+            print(f"\nNo changes made. {counts}")
+
+    def save_fingerprints(self):
+        """Keep the batch's fingerprints, once its write has succeeded, and record them."""
+        self.fingerprints.update(self.noted)
+        self.noted = {}
+        co_index.save_fingerprints(self.path, self.digest, self.fingerprints)
+
+
+class HtmlTarget(Target):
+    """index.html: news/icebreakers upserted around each company's ice: field."""
+
+    kind = "html"
+
+    def __init__(self, path, backups=0, fuzzy=False, dedup_news=False, artifacts=None,
+                 shard_size=page_artifacts.SHARD_SIZE):
+        metrics = integrate_metrics.active
+        with metrics.phase(path, "read"):
+            with open(path, "r", encoding="utf-8") as f:
+                self.text = f.read()
+            digest = co_index.content_hash(self.text)
+        metrics.add_bytes(path, "read", os.path.getsize(path))
+        super().__init__(path, digest, backups, fuzzy)
+        # None, "minify", "split" or "shard" (see page_artifacts.py)
+        self.artifacts = artifacts
+        self.shard_size = shard_size
+        # A page with a NEWS table stays interned. Interning rewrites every
+        # company's news, so it needs the full parse rather than the cached
+        # offsets; otherwise parse the CO array once (or load its offsets)
+        # and each company is a dict lookup.
+        self.interned = dedup_news or co_model.NEWS_TABLE_MARKER in self.text
+        with metrics.phase(path, "parse"):
+            if self.interned:
+                self.doc = co_model.parse_co(self.text)
+            else:
+                self.doc = co_index.load_document(path, self.text, self.digest)
+
+    def reset(self):
+        super().reset()
+        # Edits left over from a batch that failed validation
+        self.doc.discard_edits()
+
+    def names(self):
+        return self.doc.by_name.keys()
+
+    def entries(self):
+        # Index scalars are present whether the document was parsed or cached
+        return ({k: getattr(c, k) for k in co_model.INDEX_KEYS} for c in self.doc.companies)
+
+    def apply(self, name, data, fingerprint):
+        metrics = integrate_metrics.active
+        with metrics.phase(self.path, "match"):
+            target_name = self.resolve(name, data)
+            company = self.doc.by_name.get(target_name)
+        if company is None or "ice" not in company.fields:
+            return self.record("FAIL", name, "name/ice not found in CO array")
+        name = target_name
+        if not self.in_scope(name):
+            return None
+        if self.seen(name, fingerprint):
+            return self.record("SKIP", name)
+        with metrics.phase(self.path, "build"):
+            changed = changed_fields(self.doc, company, data, self.interned)
+        if not changed:
+            return self.record("SAME", name)
+        self.updates[name] = (company, changed)
+        return self.record("OK", name)
+
+    def commit(self):
+        """Validate and write the page; returns False if it is malformed."""
+        metrics = integrate_metrics.active
+        content = self.text
+        # Rewrite existing arrays in place, otherwise insert news before ice
+        # and icebreakers after it. Fragments stay as pieces until render()
+        # joins the whole page once.
+        with metrics.phase(self.path, "substitute"):
+            for company, changed in self.updates.values():
+                for key, pieces in changed:
+                    if not (self.interned and key == "news"):
+                        upsert_field(self.doc, company, key, pieces)
+            modified = bool(self.updates)
+            stats = None
+            if self.interned:
+                interned, stats = self.intern_news()
+                modified = interned or modified
+            if modified:
+                content = self.doc.render()
+        if metrics.enabled:
+            # Interned news is queued as items rather than pieces and not counted
+            metrics.add_bytes(self.path, "fragments", sum(
+                len(p) for _, changed in self.updates.values() for _, pieces in changed
+                for p in pieces if isinstance(p, str)))
+        self.report()
+        if stats:
+            print(stats + (" Page news rewritten as references." if modified and not self.updates else ""))
+
+        # The patched page is parsed before it is written: the parse is the
+        # structural check (strings and comments are consumed whole, so
+        # brackets in research text cannot trip it) and its document is the
+        # next batch's. An untouched page was parsed already (or matched an
+        # index built from a parse).
+        if content != self.text:
+            try:
+                with metrics.phase(self.path, "parse"):
+                    doc = co_model.parse_co(content)
+            except co_model.COParseError as e:
+                print(f"ERROR: patched CO array is malformed, not writing: {e}")
+                return False
+            print("Syntax check: CO array structure is valid.")
+            with metrics.phase(self.path, "write"):
+                integrate_io.atomic_write(self.path, content, backups=self.backups)
+            metrics.add_bytes(self.path, "written", os.path.getsize(self.path))
+            self.text = content
+            self.digest = co_index.content_hash(content)
+            self.doc = doc
+            with metrics.phase(self.path, "index"):
+                co_index.save_index(self.path, doc, self.digest)
+        else:
+            print("Syntax check: page unchanged, nothing to validate.")
+        with metrics.phase(self.path, "write"):
+            self.save_fingerprints()
+        if self.artifacts:
+            with metrics.phase(self.path, "artifacts"):
+                written = page_artifacts.write_artifacts(self.path, content, self.artifacts, self.shard_size)
+            metrics.add_bytes(self.path, "artifacts", sum(size for _, size in written))
+            print(f"Artifacts (page {len(content.encode('utf-8'))} bytes): "
+                  + ", ".join(f"{os.path.basename(p)} {size}" for p, size in written)
+                  + ("" if page_artifacts.brotli else " (no .br: brotli not installed)"))
+        return True
+
+    def intern_news(self):
+        """Queue edits storing each distinct news item once in the NEWS table.
+
+        Every company's news becomes a list of NEWS[i] references, research
+        updates included. Items are numbered in page order, so an interned
+        page re-renders byte for byte. Returns True if anything changes.
+        """
+        doc = self.doc
+        research = {id(company): value for company, changed in self.updates.values()
+                    for key, value in changed if key == "news"}
+        ids = {}
+        modified = False
+        refs = inline_bytes = ref_bytes = 0
+        for company in doc.companies:
+            items = research.get(id(company))
+            escape = escape_for_js
+            if items is None:
+                if "news" not in company.fields:
+                    continue
+                items = [n.to_dict() for n in company.news]
+                escape = escape_verbatim
+            pieces = ["news:["]
+            for n, item in enumerate(items):
+                literal = news_item_literal(item, escape)
+                ref = f"NEWS[{ids.setdefault(literal, len(ids))}]"
+                pieces += (",", ref) if n else (ref,)
+                refs += 1
+                inline_bytes += len(literal) + bool(n)
+                ref_bytes += len(ref) + bool(n)
+            pieces.append("]")
+            if not doc.field_equals(company, "news", pieces):
+                upsert_field(doc, company, "news", pieces)
+                modified = True
+
+        table = "const NEWS = [" + ("\n  " + ",\n  ".join(ids) + "\n" if ids else "") + "];\n"
+        current = co_model.parse_news_table(self.text)
+        if current is None:
+            line_start = self.text.rfind("\n", 0, doc.start) + 1
+            doc.replace_span(line_start, line_start, table)
+            modified = True
+        elif self.text[current.start:current.end] != table:
+            doc.replace_span(current.start, current.end, table)
+            modified = True
+        stats = (f"News table: {refs} items, {len(ids)} unique, {refs - len(ids)} duplicates folded; "
+                 f"news payload {inline_bytes} -> {len(table) + ref_bytes} bytes.")
+        return modified, stats
+
+
+class JsonTarget(Target):
+    """A JSON array of company objects, streamed record by record.
+
+    Research is queued by name; commit() then reads the array a chunk at a
+    time, re-serializes only the records it changes and copies every other
+    byte straight to the output. Memory stays at about one chunk plus the
+    queued research, however large the dataset grows.
+    """
+
+    kind = "json"
+
+    def __init__(self, path, backups=0, fuzzy=False, **page_options):
+        # page_options (dedup_news, artifacts, shard_size) only apply to the HTML page;
+        # the eventiq app reads these records as they are
+        with integrate_metrics.active.phase(path, "read"):
+            digest = co_index.file_hash(path)
+        super().__init__(path, digest, backups, fuzzy)
+        self.index_entries = None
+        self.name_set = None
+        # name -> (data, fingerprint) waiting for the streaming pass
+        self.pending = {}
+
+    def entries(self):
+        """INDEX_KEYS of every record, from the entries sidecar when current."""
+        if self.index_entries is None:
+            entries = co_index.load_entries(self.path, self.digest)
+            if entries is None:
+                with open(self.path, "r", encoding="utf-8", newline="") as f:
+                    entries = [{k: obj.get(k) for k in co_model.INDEX_KEYS}
+                               for _, raw, obj in iter_json_array(f)
+                               if raw is not None and isinstance(obj, dict)]
+                try:
+                    co_index.save_entries(self.path, self.digest, entries)
+                except OSError:
+                    pass
+            self.index_entries = entries
+        return self.index_entries
+
+    def names(self):
+        if self.name_set is None:
+            self.name_set = {e["name"] for e in self.entries() if isinstance(e["name"], str)}
+        return self.name_set
+
+    def apply(self, name, data, fingerprint):
+        """Queue research for name; its status is known after commit()."""
+        with integrate_metrics.active.phase(self.path, "match"):
+            target_name = self.resolve(name, data)
+        if target_name is None:
+            return self.record("FAIL", name, "name not found in JSON array")
+        name = target_name
+        if not self.in_scope(name):
+            return None
+        if self.fingerprints.get(name) == fingerprint:
+            self.pending.pop(name, None)
+            return self.record("SKIP", name)
+        self.pending[name] = (data, fingerprint)
+        return None
+
+    def commit(self):
+        """Stream the file, splicing in changed records; returns True."""
+        if self.pending:
+            with integrate_metrics.active.phase(self.path, "stream"):
+                self.stream()
+        self.report()
+        self.save_fingerprints()
+        return True
+
+    def stream(self):
+        pending = self.pending
+        hasher = hashlib.sha256()
+        changed = 0
+        size = 0
+        metrics = integrate_metrics.active
+        metrics.add_bytes(self.path, "read", os.path.getsize(self.path))
+        with open(self.path, "r", encoding="utf-8", newline="") as src, \
+                integrate_io.AtomicWriter(self.path, self.backups) as out:
+            def emit(text):
+                nonlocal size
+                out.write(text)
+                data = text.encode("utf-8")
+                hasher.update(data)
+                size += len(data)
+
+            for between, raw, obj in iter_json_array(src):
+                emit(between)
+                if raw is None:
+                    break
+                name = obj.get("name") if isinstance(obj, dict) else None
+                entry = pending.pop(name, None)
+                if entry is None:
+                    emit(raw)
+                    continue
+                data, fingerprint = entry
+                self.noted[name] = fingerprint
+                updated = dict(obj)
+                for key in ("news", "icebreakers"):
+                    if data[key] is not None:
+                        updated[key] = data[key]
+                if updated == obj:
+                    self.record("SAME", name)
+                    emit(raw)
+                    continue
+                self.record("OK", name)
+                indent = between.rsplit("\n", 1)[-1]
+                emit(dump_record(updated, indent if not indent.strip() else ""))
+                changed += 1
+            if changed:
+                out.commit()
+                metrics.add_bytes(self.path, "written", size)
+                self.digest = hasher.hexdigest()
+                if self.index_entries is not None:
+                    # Only news/icebreakers changed, so the entries still hold
+                    try:
+                        co_index.save_entries(self.path, self.digest, self.index_entries)
+                    except OSError:
+                        pass
+        for name in pending:
+            self.record("FAIL", name, "name not found in JSON array")
+        pending.clear()
+
+
+def iter_json_array(f, chunk_size=1 << 16):
+    """Yield (between, raw, obj) for each record of a top-level JSON array.
+
+    between is the source text since the previous record (the opening
+    bracket, commas, whitespace) and raw is the record's exact source. The
+    final item is (tail, None, None) with everything from the closing
+    bracket on. Only the current chunk and record are held in memory.
+    """
+    decoder = json.JSONDecoder()
+    buf = ""
+    eof = False
+
+    def more():
+        nonlocal buf, eof
+        chunk = f.read(chunk_size)
+        eof = not chunk
+        buf += chunk
+
+    more()
+    while "[" not in buf:
+        if eof:
+            raise ValueError("not a JSON array")
+        more()
+    seg = 0                      # start of the text not yet yielded
+    pos = buf.index("[") + 1
+    while True:
+        # Skip separators, refilling the buffer as needed
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n,":
+                pos += 1
+            if pos < len(buf) or eof:
+                break
+            more()
+        if pos >= len(buf):
+            raise ValueError("unterminated JSON array")
+        if buf[pos] == "]":
+            # Whatever follows the closing bracket is just a newline or two
+            yield buf[seg:] + f.read(), None, None
+            return
+        while True:
+            try:
+                obj, end = decoder.raw_decode(buf, pos)
+                break
+            except json.JSONDecodeError:
+                # Most likely the record runs past the buffer
+                if eof:
+                    raise
+                more()
+        yield buf[seg:pos], buf[pos:end], obj
+        seg = pos = end
+        if seg > chunk_size:
+            buf = buf[seg:]
+            seg = pos = 0
+
+
+def dump_record(obj, indent):
+    """Serialize one record like JSON.stringify(obj, null, 2) at an indent."""
+    # JSON strings never contain a raw newline, so re-indenting lines is safe
+    return json.dumps(obj, indent=2, ensure_ascii=False).replace("\n", "\n" + indent)
+
+
+TARGET_TYPES = {".html": HtmlTarget, ".htm": HtmlTarget, ".json": JsonTarget}
+
+
+def target_type(path):
+    """Return the adapter class for a target file, chosen by its extension.
+
+    Raises ValueError if there is none.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in TARGET_TYPES:
+        raise ValueError(f"no target adapter for {path!r} (expected .html or .json)")
+    return TARGET_TYPES[ext]
+
+
+def open_target(path, backups=0, fuzzy=False, **page_options):
+    """Return the adapter for a target file.
+
+    page_options are passed to HtmlTarget (dedup_news, artifacts, shard_size).
+    """
+    return target_type(path)(path, backups, fuzzy, **page_options)
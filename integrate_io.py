@@ -0,0 +1,111 @@
+"""
+Crash-safe file writes for the integrator.
+
+The page is written to a temp file in the same directory, fsynced, then
+renamed over the target. Readers (and the deployed site) see either the
+old file or the new one, never a truncated mix. The previous version can
+optionally be kept as <file>.bak, <file>.bak.1, ...
+"""
+
+import os
+import shutil
+import stat
+import tempfile
+
+
+def backup_path(path, n):
+    return f"{path}.bak" if n == 0 else f"{path}.bak.{n}"
+
+
+def rotate_backups(path, keep):
+    """Shift existing backups up by one and save the current file as .bak."""
+    if keep <= 0 or not os.path.exists(path):
+        return
+    for n in range(keep - 1, 0, -1):
+        older = backup_path(path, n - 1)
+        if os.path.exists(older):
+            os.replace(older, backup_path(path, n))
+    bak = backup_path(path, 0)
+    if os.path.exists(bak):
+        os.remove(bak)
+    try:
+        # A hard link keeps the old inode alive once the new file replaces it
+        os.link(path, bak)
+    except OSError:
+        shutil.copy2(path, bak)
+
+
+def fsync_dir(directory):
+    """Flush a directory entry change (the rename) to disk where supported."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class AtomicWriter:
+    """Writer for a temp file that replaces path only on commit().
+
+    Used as a context manager; leaving the block without commit() (or with
+    an exception) removes the temp file and leaves path untouched.
+    """
+
+    def __init__(self, path, backups=0, binary=False):
+        self.path = path
+        self.backups = backups
+        self.directory = os.path.dirname(os.path.abspath(path))
+        fd, self.tmp = tempfile.mkstemp(prefix="." + os.path.basename(path) + ".", suffix=".tmp",
+                                        dir=self.directory)
+        if binary:
+            self.file = os.fdopen(fd, "wb")
+        else:
+            self.file = os.fdopen(fd, "w", encoding="utf-8", newline="")
+
+    def write(self, text):
+        self.file.write(text)
+
+    def commit(self):
+        try:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.file.close()
+            try:
+                os.chmod(self.tmp, stat.S_IMODE(os.stat(self.path).st_mode))
+            except FileNotFoundError:
+                os.chmod(self.tmp, 0o644)
+            rotate_backups(self.path, self.backups)
+            os.replace(self.tmp, self.path)
+        except BaseException:
+            self.discard()
+            raise
+        self.tmp = None
+        fsync_dir(self.directory)
+
+    def discard(self):
+        self.file.close()
+        if self.tmp is not None:
+            try:
+                os.remove(self.tmp)
+            except OSError:
+                pass
+            self.tmp = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.discard()
+        return False
+
+
+def atomic_write(path, data, backups=0):
+    """Write text or bytes to path atomically, keeping up to `backups` old versions."""
+    with AtomicWriter(path, backups, binary=isinstance(data, bytes)) as f:
+        f.write(data)
+        f.commit()
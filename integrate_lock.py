@@ -0,0 +1,249 @@
+"""
+Cross-process locking and write coalescing for integrate_research.py.
+
+Scheduled jobs (the daily news refresh, refresh-news, deploy) can run the
+integrator against the same file at once. Each read-modify-write would
+otherwise silently drop the other's changes. Every target therefore has
+an advisory lock, .integrate_cache/<file>.lock (fcntl.flock), held from
+before the file is read until after it is written.
+
+A run that finds the lock taken does not queue up to redo the whole
+read/parse/write. Its research goes into the target's spool directory,
+.integrate_cache/<file>.spool/, and the run then waits for the lock.
+Before writing, the lock holder applies every spooled batch made with the
+same options after its own research (spooled research is newer) and
+writes once. Only if that write succeeded does it leave each waiter the
+results of its companies in <spool file>.result and delete the spool
+file. The waiter gets the lock, finds its spool file gone, reports those
+results (failing on its own FAILs, which do not count against the
+holder) and is done without reading the target at all. If its file is still there, because it came
+too late for that write or the holder failed, the waiter runs the usual
+way under the lock.
+
+Spool files left by a run that died while waiting are merged by the next
+lock holder. Without fcntl (Windows) there is no locking and every run
+writes on its own.
+"""
+
+import json
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:  # Optional: no cross-process locking without it
+    fcntl = None
+
+import co_index
+import integrate_io
+
+RESULT_SUFFIX = ".result"
+# Uncollected results older than this are removed by the next holder
+RESULT_TTL = 3600
+
+
+class FileLock:
+    """Advisory exclusive lock and spool directory for one target."""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock_path = co_index.cache_path(path, ".lock")
+        self.spool_dir = co_index.cache_path(path, ".spool")
+        self.fd = None
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.lock_path), exist_ok=True)
+        return os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    def acquire(self, blocking=True):
+        """Take the lock; with blocking=False, return False if another run has it."""
+        if fcntl is None:
+            return True
+        fd = self._open()
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        self.fd = fd
+        return True
+
+    def release(self):
+        if self.fd is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+            os.close(self.fd)
+            self.fd = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+        return False
+
+    def spool(self, options, records):
+        """Hand [(name, data, fingerprint)] to the lock holder; returns the spool file."""
+        os.makedirs(self.spool_dir, exist_ok=True)
+        path = os.path.join(self.spool_dir, f"{time.time_ns()}-{os.getpid()}.ndjson")
+        lines = [json.dumps({"options": options}, sort_keys=True)]
+        lines += [json.dumps({"name": name, "data": data, "fingerprint": fingerprint}, ensure_ascii=False)
+                  for name, data, fingerprint in records]
+        integrate_io.atomic_write(path, "\n".join(lines) + "\n")
+        return path
+
+    def drain(self, options):
+        """Return [(spool file, [(name, data, fingerprint)])] made with options, oldest first.
+
+        Call with the lock held. Files written with other options, or that
+        cannot be read, are left for their own run.
+        """
+        try:
+            listing = os.listdir(self.spool_dir)
+        except FileNotFoundError:
+            return []
+        names = sorted(n for n in listing if n.endswith(".ndjson"))
+        # Results nobody collected: their waiter died after spooling
+        now = time.time()
+        for name in listing:
+            path = os.path.join(self.spool_dir, name)
+            try:
+                if name.endswith(RESULT_SUFFIX) and now - os.path.getmtime(path) > RESULT_TTL:
+                    os.remove(path)
+            except OSError:
+                pass
+        batches = []
+        for name in names:
+            path = os.path.join(self.spool_dir, name)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    header, *rows = [json.loads(line) for line in f if line.strip()]
+            except (OSError, ValueError):
+                continue
+            if header.get("options") != options:
+                continue
+            batches.append((path, [(r["name"], r["data"], r["fingerprint"]) for r in rows]))
+        return batches
+
+    def consume(self, paths):
+        """Delete spool files whose research has been written."""
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def finish(self, results):
+        """Hand each waiter its results ({spool file: [(status, name, detail)]}) and consume its file."""
+        for path, rows in results.items():
+            integrate_io.atomic_write(path + RESULT_SUFFIX, json.dumps(rows, ensure_ascii=False))
+        self.consume(results)
+
+    def collect(self, spooled):
+        """Return (and remove) the results the holder left for a consumed spool file.
+
+        None if there are none, e.g. the holder died between writing and
+        reporting.
+        """
+        try:
+            with open(spooled + RESULT_SUFFIX, "r", encoding="utf-8") as f:
+                rows = json.load(f)
+        except (OSError, ValueError):
+            return None
+        self.consume([spooled + RESULT_SUFFIX])
+        return [tuple(row) for row in rows]
+
+
+def commit_merged(lock, target, options):
+    """Apply waiting runs' spooled research to target and commit it.
+
+    Call with the lock held, after the run's own research. Spool files are
+    deleted only if the commit succeeds, after their results are written
+    back for the waiters. Returns the commit's result.
+    """
+    batches = lock.drain(options)
+    for path, records in batches:
+        target.origin = path
+        for name, data, fingerprint in records:
+            target.apply(name, data, fingerprint)
+    target.origin = None
+    if batches:
+        print(f"Merged {sum(len(r) for _, r in batches)} companies from {len(batches)} waiting run(s).")
+    ok = target.commit()
+    if ok:
+        lock.finish({path: target.results_from(path) for path, _ in batches})
+    return ok
+
+
+class CoalescingTarget:
+    """A target taken under its FileLock, or handed to the run that holds it.
+
+    opener(path) opens the real target (see co_targets.open_target). options
+    is anything JSON-comparable that must match for two runs to share a
+    write, e.g. the selection and the page options.
+    """
+
+    def __init__(self, path, opener, options):
+        self.path = path
+        self.opener = opener
+        self.options = options
+        self.lock = FileLock(path)
+        self.queued = {}
+        # Results the lock holder reported for research it integrated for us
+        self.handed_results = []
+        # The holder reads the file only once it has the lock
+        self.target = opener(path) if self.lock.acquire(blocking=False) else None
+
+    def apply(self, name, data, fingerprint):
+        if self.target is not None:
+            return self.target.apply(name, data, fingerprint)
+        # A later record for the same company wins, as in Target.updates
+        self.queued[name] = (data, fingerprint)
+        return None
+
+    def commit(self):
+        """Write the target once, with any waiting runs' research merged in."""
+        if self.target is None and not self.wait():
+            return True
+        try:
+            return commit_merged(self.lock, self.target, self.options)
+        finally:
+            self.lock.release()
+
+    def wait(self):
+        """Spool this run's research and wait for the lock.
+
+        Returns False if there is nothing to write or the holder integrated
+        it; otherwise the target is opened under the lock with this run's
+        research applied.
+        """
+        records = [(name, data, fingerprint) for name, (data, fingerprint) in self.queued.items()]
+        if not records:
+            return False
+        spooled = self.lock.spool(self.options, records)
+        print(f"{self.path} is locked by another run; handed it {len(records)} companies.")
+        self.lock.acquire()
+        if not os.path.exists(spooled):
+            self.handed_results = self.lock.collect(spooled) or []
+            self.lock.release()
+            print("Integrated by that run:")
+            for status, name, detail in self.handed_results:
+                if status != "SKIP":
+                    print(f"  {status}  {name}" + (f" -- {detail}" if detail else ""))
+            return False
+        self.lock.consume([spooled])
+        print("Not picked up; integrating here.")
+        self.target = self.opener(self.path)
+        for name, data, fingerprint in records:
+            self.target.apply(name, data, fingerprint)
+        return True
+
+    def failed(self):
+        if self.target is None:
+            return {name for status, name, _ in self.handed_results if status == "FAIL"}
+        return self.target.failed()
+
+    def count(self, status):
+        if self.target is None:
+            return sum(1 for r in self.handed_results if r[0] == status)
+        return self.target.count(status)
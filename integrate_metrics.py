@@ -0,0 +1,158 @@
+"""
+Per-phase and per-company metrics for integrate_research.py.
+
+Instrumented code reports to `integrate_metrics.active`. By default that is
+NULL, whose methods do nothing and whose phase() hands back one shared
+no-op context manager, so a run without --metrics does no timing and
+allocates nothing. main() swaps in a Metrics collector when asked and
+writes it out at the end as JSON or OpenMetrics text.
+
+Collected per target:
+  phases     seconds spent in read, parse, match, build, substitute,
+             write, index, ... (summed when a phase runs repeatedly)
+  bytes      bytes read, written and spliced in as fragments
+  companies  seconds spent matching and diffing each company
+  statuses   OK / SAME / SKIP / FAIL counts
+"""
+
+import json
+import time
+from contextlib import nullcontext
+
+import integrate_io
+
+
+class NullMetrics:
+    """Disabled metrics: every call is a no-op."""
+
+    enabled = False
+    _phase = nullcontext()
+
+    def phase(self, target, name):
+        return self._phase
+
+    def add_bytes(self, target, kind, n):
+        pass
+
+    def company(self, target, name, seconds):
+        pass
+
+    def statuses(self, target, counts):
+        pass
+
+    def families(self):
+        return []
+
+
+class _Phase:
+    __slots__ = ("metrics", "target", "name", "start")
+
+    def __init__(self, metrics, target, name):
+        self.metrics = metrics
+        self.target = target
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        phases = self.metrics.target(self.target)["phases"]
+        phases[self.name] = phases.get(self.name, 0.0) + time.perf_counter() - self.start
+        return False
+
+
+class Metrics:
+    """Collects timings and counters keyed by target path."""
+
+    enabled = True
+
+    def __init__(self):
+        self.started = time.time()
+        self.start = time.perf_counter()
+        self.targets = {}
+
+    def target(self, target):
+        entry = self.targets.get(target)
+        if entry is None:
+            entry = self.targets[target] = {"phases": {}, "bytes": {}, "companies": {}, "statuses": {}}
+        return entry
+
+    def phase(self, target, name):
+        """Context manager adding the block's wall time to target's phase."""
+        return _Phase(self, target, name)
+
+    def add_bytes(self, target, kind, n):
+        counts = self.target(target)["bytes"]
+        counts[kind] = counts.get(kind, 0) + n
+
+    def company(self, target, name, seconds):
+        companies = self.target(target)["companies"]
+        companies[name] = companies.get(name, 0.0) + seconds
+
+    def statuses(self, target, counts):
+        self.target(target)["statuses"].update(counts)
+
+    def to_json(self):
+        return {
+            "started": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self.started)),
+            "seconds": time.perf_counter() - self.start,
+            "targets": self.targets,
+        }
+
+    def families(self):
+        """Return [(name, kind, help, [(labels, value)])] for openmetrics_text()."""
+        targets = self.targets.items()
+        return [
+            ("integrate_run_seconds", "gauge", "Wall time of the whole run.",
+             [((), time.perf_counter() - self.start)]),
+            ("integrate_phase_seconds", "gauge", "Wall time per target and phase.",
+             [((("target", t), ("phase", p)), v) for t, m in targets for p, v in m["phases"].items()]),
+            ("integrate_bytes", "counter", "Bytes read, written and spliced per target.",
+             [((("target", t), ("kind", k)), v) for t, m in targets for k, v in m["bytes"].items()]),
+            ("integrate_companies", "gauge", "Companies per target and status.",
+             [((("target", t), ("status", s)), v) for t, m in targets for s, v in m["statuses"].items()]),
+            ("integrate_company_seconds", "gauge", "Time spent matching and diffing a company.",
+             [((("target", t), ("company", c)), v) for t, m in targets for c, v in m["companies"].items()]),
+        ]
+
+    def to_openmetrics(self):
+        """Render as OpenMetrics text exposition (ends with # EOF)."""
+        return openmetrics_text(self.families())
+
+    def write(self, path, fmt="json"):
+        text = (self.to_openmetrics() if fmt == "openmetrics"
+                else json.dumps(self.to_json(), indent=2, sort_keys=True) + "\n")
+        integrate_io.atomic_write(path, text)
+
+
+def openmetrics_text(families):
+    """Render [(name, kind, help, [(labels, value)])] as OpenMetrics text.
+
+    labels is a tuple of (key, value) pairs; counters get the _total suffix.
+    """
+    lines = []
+    for name, kind, help_, samples in families:
+        lines.append(f"# TYPE {name} {kind}")
+        lines.append(f"# HELP {name} {help_}")
+        suffix = "_total" if kind == "counter" else ""
+        for labels, value in samples:
+            rendered = ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels)
+            lines.append(f"{name}{suffix}" + (f"{{{rendered}}}" if rendered else "") + f" {value}")
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+NULL = NullMetrics()
+active = NULL
+
+
+def enable():
+    """Start collecting; returns the Metrics object now in `active`."""
+    global active
+    active = Metrics()
+    return active
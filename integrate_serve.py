@@ -0,0 +1,337 @@
+"""
+Ingestion service for integrate_research.py (--serve).
+
+Research workers submit companies one at a time instead of running the
+integrator per company. The service keeps the targets parsed (as watch
+mode does), queues each submission and flushes the queue as one batch:
+every target is read-modified-written once per batch, not once per
+company. A batch is flushed when `batch_size` companies are waiting or
+when the oldest has waited `window` seconds, whichever comes first.
+
+It speaks a minimal HTTP/1.1 on a loopback TCP port or a Unix socket and
+needs no network beyond that:
+
+  POST /research   one research record, a JSON array of them, or NDJSON
+                   (the research.ndjson shape); 202 {"queued", "unchanged",
+                   "depth", "errors"}. Records of the wrong shape are
+                   listed in errors and never queued; 400 if none is valid
+  GET  /stats      queue depth, batch counts and flush latency as JSON
+  GET  /metrics    the same as OpenMetrics text, plus the per-phase
+                   metrics when --metrics is on
+
+A later submission for a company still in the queue replaces it, and one
+whose research matches what was last queued is not queued again. On
+SIGINT/SIGTERM the server stops accepting and flushes what is queued.
+"""
+
+import asyncio
+import json
+import os
+import signal
+import socket
+import stat
+import time
+
+import integrate_metrics
+
+DEFAULT_ADDRESS = "127.0.0.1:8765"
+BATCH_SIZE = 64
+WINDOW = 5.0
+
+MAX_BODY = 16 << 20
+READ_TIMEOUT = 30.0
+REASONS = {200: "OK", 202: "Accepted", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 408: "Request Timeout", 411: "Length Required",
+           413: "Payload Too Large"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def parse_address(address):
+    """Return ("unix", path) for "unix:PATH", else ("tcp", (host, port)) for "HOST:PORT"."""
+    if address.startswith("unix:"):
+        return "unix", address[len("unix:"):]
+    host, _, port = address.rpartition(":")
+    try:
+        return "tcp", (host or "127.0.0.1", int(port))
+    except ValueError:
+        raise ValueError(f"bad address {address!r}: expected HOST:PORT or unix:PATH") from None
+
+
+def parse_payload(body):
+    """Return the research records in a request body.
+
+    The body is a JSON object, a JSON array of objects, or one object per
+    line. Raises ValueError if it is none of these.
+    """
+    text = body.decode("utf-8")
+    try:
+        raw = json.loads(text)
+    except ValueError:
+        raw = [json.loads(line) for line in text.splitlines() if line.strip()]
+    records = raw if isinstance(raw, list) else [raw]
+    if not records:
+        raise ValueError("no research records in the request body")
+    return records
+
+
+class IngestService:
+    """Queues submitted research on a Watcher and flushes it in batches.
+
+    The watcher (see integrate_watch.py) owns the queue and the hot targets;
+    normalize(record) returns (name, data) like normalize_research(). Batches
+    are integrated in a worker thread, one at a time, so the event loop keeps
+    accepting submissions into the next batch meanwhile.
+    """
+
+    def __init__(self, watcher, normalize, batch_size=BATCH_SIZE, window=WINDOW):
+        self.watcher = watcher
+        self.normalize = normalize
+        self.batch_size = batch_size
+        self.window = window
+        self.wake = asyncio.Event()
+        self.stopping = False
+        self.flushing = False
+        self.ok = True
+        # Counters for /stats and /metrics
+        self.received = 0
+        self.unchanged = 0
+        self.rejected = 0
+        self.flushed = 0
+        self.failed_batches = 0
+        self.flush_seconds = 0.0
+        self.max_flush_seconds = 0.0
+        self.last_flush = None
+
+    @property
+    def depth(self):
+        return len(self.watcher.pending)
+
+    def submit(self, records):
+        """Queue records; returns the response for a POST /research."""
+        queued = unchanged = 0
+        errors = []
+        for i, rec in enumerate(records):
+            try:
+                name, data = self.normalize(rec)
+            except ValueError as e:
+                errors.append(f"[{i}] {e}")
+                continue
+            if self.watcher.submit(name, data):
+                queued += 1
+            else:
+                unchanged += 1
+        self.received += queued + unchanged
+        self.unchanged += unchanged
+        self.rejected += len(errors)
+        if errors and not (queued or unchanged):
+            raise HTTPError(400, "no valid research records: " + "; ".join(errors))
+        if queued:
+            self.wake.set()  # The flusher checks the size and (re)arms the window
+        return {"queued": queued, "unchanged": unchanged, "depth": self.depth, "errors": errors}
+
+    def due(self):
+        return self.depth >= self.batch_size or self.watcher.due()
+
+    async def flusher(self):
+        """Flush whenever a batch fills or its window closes, until stopped."""
+        while not self.stopping:
+            timeout = None
+            if self.watcher.pending:
+                timeout = max(0.0, self.watcher.first_change + self.window - time.monotonic())
+            try:
+                await asyncio.wait_for(self.wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self.wake.clear()
+            if self.due() and not self.stopping:
+                await self.flush()
+
+    async def flush(self):
+        """Integrate the queued companies as one batch."""
+        # Targets edited by someone else are reopened first; that parse runs on
+        # the loop, but only after an outside edit
+        self.watcher.poll_targets()
+        pending, research = self.watcher.take()
+        if not pending:
+            return True
+        self.flushing = True
+        start = time.perf_counter()
+        try:
+            ok = await asyncio.to_thread(self.watcher.integrate, pending, research)
+        except OSError as e:
+            # Disk full, permissions: worth another try with the next batch.
+            # Nothing from the failed write was fingerprinted, so it is redone.
+            print(f"ERROR: batch {self.watcher.batches} not written, requeued: {e!r}")
+            for name, (data, fingerprint) in pending.items():
+                if name not in self.watcher.pending:
+                    self.watcher.queue(name, data, fingerprint)
+            ok = False
+        except Exception as e:  # noqa: BLE001 -- keep serving; retrying would fail the same way
+            print(f"ERROR: batch {self.watcher.batches} failed, dropped: {e!r}")
+            ok = False
+        finally:
+            self.flushing = False
+        seconds = time.perf_counter() - start
+        self.flushed += len(pending)
+        self.flush_seconds += seconds
+        self.max_flush_seconds = max(self.max_flush_seconds, seconds)
+        if not ok:
+            self.failed_batches += 1
+        self.ok = ok and self.ok
+        self.last_flush = {"batch": self.watcher.batches, "companies": len(pending),
+                           "seconds": seconds, "ok": ok,
+                           "at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())}
+        return ok
+
+    def stats(self):
+        batches = self.watcher.batches
+        return {
+            "depth": self.depth,
+            "batch_size": self.batch_size,
+            "window": self.window,
+            "flushing": self.flushing,
+            "received": self.received,
+            "unchanged": self.unchanged,
+            "rejected": self.rejected,
+            "batches": batches,
+            "failed_batches": self.failed_batches,
+            "companies_flushed": self.flushed,
+            "flush_seconds": {
+                "total": self.flush_seconds,
+                "mean": self.flush_seconds / batches if batches else 0.0,
+                "max": self.max_flush_seconds,
+            },
+            "last_flush": self.last_flush,
+        }
+
+    def openmetrics(self):
+        families = [
+            ("integrate_queue_depth", "gauge", "Companies waiting for the next batch.",
+             [((), self.depth)]),
+            ("integrate_submissions", "counter", "Research records received, by outcome.",
+             [((("outcome", "queued"),), self.received - self.unchanged),
+              ((("outcome", "unchanged"),), self.unchanged),
+              ((("outcome", "rejected"),), self.rejected)]),
+            ("integrate_batches", "counter", "Batches flushed, by result.",
+             [((("result", "ok"),), self.watcher.batches - self.failed_batches),
+              ((("result", "failed"),), self.failed_batches)]),
+            ("integrate_flushed_companies", "counter", "Companies integrated in flushed batches.",
+             [((), self.flushed)]),
+            ("integrate_flush_seconds", "counter", "Time spent integrating batches.",
+             [((), self.flush_seconds)]),
+            ("integrate_flush_max_seconds", "gauge", "Longest batch integration.",
+             [((), self.max_flush_seconds)]),
+        ]
+        return integrate_metrics.openmetrics_text(families + integrate_metrics.active.families())
+
+    async def handle(self, reader, writer):
+        """Serve one request per connection."""
+        try:
+            try:
+                method, path, body = await asyncio.wait_for(read_request(reader), READ_TIMEOUT)
+                status, content_type, payload = self.route(method, path, body)
+            except asyncio.TimeoutError:
+                status, content_type, payload = 408, "application/json", {"error": "request timed out"}
+            except HTTPError as e:
+                status, content_type, payload = e.status, "application/json", {"error": str(e)}
+            if content_type == "application/json":
+                payload = json.dumps(payload, indent=1) + "\n"
+            data = payload.encode("utf-8")
+            writer.write((f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                          f"Content-Type: {content_type}; charset=utf-8\r\n"
+                          f"Content-Length: {len(data)}\r\n"
+                          "Connection: close\r\n\r\n").encode("ascii") + data)
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass  # Client went away
+        finally:
+            writer.close()
+
+    def route(self, method, path, body):
+        path = path.split("?", 1)[0]
+        if path == "/research":
+            if method != "POST":
+                raise HTTPError(405, "use POST")
+            try:
+                records = parse_payload(body)
+            except ValueError as e:
+                raise HTTPError(400, f"bad JSON: {e}") from None
+            return 202, "application/json", self.submit(records)
+        if path in ("/stats", "/metrics"):
+            if method != "GET":
+                raise HTTPError(405, "use GET")
+            if path == "/stats":
+                return 200, "application/json", self.stats()
+            return 200, "application/openmetrics-text; version=1.0.0", self.openmetrics()
+        raise HTTPError(404, f"no such endpoint {path}")
+
+    async def serve(self, address=DEFAULT_ADDRESS):
+        """Serve until SIGINT/SIGTERM, then flush the queue; returns True if every batch succeeded."""
+        kind, where = parse_address(address)
+        if kind == "unix":
+            if os.path.exists(where) and _is_socket(where):
+                os.remove(where)  # Left behind by a previous run
+            server = await asyncio.start_unix_server(self.handle, path=where)
+        else:
+            server = await asyncio.start_server(self.handle, *where, family=socket.AF_UNSPEC)
+        loop = asyncio.get_running_loop()
+        stop = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+        flusher = asyncio.create_task(self.flusher())
+        print(f"Serving on {address} (batch {self.batch_size}, window {self.window:g}s); "
+              "Ctrl-C to stop.")
+        try:
+            await stop.wait()
+        finally:
+            server.close()
+            await server.wait_closed()
+            self.stopping = True
+            self.wake.set()
+            await flusher
+            if self.watcher.pending:
+                await self.flush()
+            if kind == "unix" and os.path.exists(where):
+                os.remove(where)
+        return self.ok
+
+
+def _is_socket(path):
+    return stat.S_ISSOCK(os.stat(path).st_mode)
+
+
+async def read_request(reader):
+    """Return (method, path, body) of one HTTP/1.1 request."""
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.LimitOverrunError:
+        raise HTTPError(400, "request headers too large") from None
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, path, _ = lines[0].split(" ", 2)
+    except ValueError:
+        raise HTTPError(400, "malformed request line") from None
+    headers = {}
+    for line in lines[1:]:
+        key, sep, value = line.partition(":")
+        if sep:
+            headers[key.strip().lower()] = value.strip()
+    body = b""
+    if method == "POST":
+        if "transfer-encoding" in headers:
+            raise HTTPError(411, "send a Content-Length, not a chunked body")
+        try:
+            length = int(headers["content-length"])
+        except (KeyError, ValueError):
+            raise HTTPError(411, "Content-Length required") from None
+        if length < 0:
+            raise HTTPError(400, "negative Content-Length")
+        if length > MAX_BODY:
+            raise HTTPError(413, f"body over {MAX_BODY} bytes")
+        body = await reader.readexactly(length)
+    return method, path, body
@@ -0,0 +1,180 @@
+"""
+Watch mode for integrate_research.py (--watch).
+
+The targets are opened and parsed once and kept in memory between
+batches. The research sources are polled by mtime and size. When they
+change, the research is re-read and only companies whose fingerprint
+differs from what this session last integrated are queued. Writes are
+debounced: a batch is flushed once the sources have been quiet for
+`debounce` seconds (or after `max_wait` seconds of continuous changes),
+so a burst of edits becomes a single write per target.
+
+A target edited by someone else is reopened, and the research seen so
+far is queued against it again. Each batch is written under the target's
+FileLock, merging research spooled by one-shot runs that were waiting for
+it (see integrate_lock.py).
+"""
+
+import os
+import time
+
+import integrate_lock
+
+
+def stamp(path):
+    """(mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class Watcher:
+    """Coalesces research changes into batched writes against hot targets.
+
+    sources() lists the files to poll, load() yields (name, data) research
+    records, fingerprint(data) hashes one, and reopen(path) returns a fresh
+    target for a file that changed underneath us. options are the lock
+    options spooled research must match to be merged. on_batch(targets),
+    if given, runs after every batch (watch and serve write --metrics there).
+    """
+
+    def __init__(self, targets, sources, load, fingerprint, reopen,
+                 interval=1.0, debounce=2.0, max_wait=None, options=None, on_batch=None):
+        self.targets = targets
+        self.sources = sources
+        self.load = load
+        self.fingerprint = fingerprint
+        self.reopen = reopen
+        self.options = options
+        self.on_batch = on_batch
+        self.interval = interval
+        self.debounce = debounce
+        self.max_wait = max_wait if max_wait is not None else 10 * debounce
+        self.known = {}          # name -> fingerprint last queued this session
+        self.research = {}       # name -> (data, fingerprint) last read
+        self.pending = {}        # name -> (data, fingerprint) waiting for a flush
+        self.first_change = self.last_change = None
+        self.source_stamps = {}
+        self.target_stamps = {t.path: stamp(t.path) for t in targets}
+        self.batches = 0
+
+    def poll_sources(self):
+        """Re-read research if any source changed; queue changed companies."""
+        stamps = {path: stamp(path) for path in self.sources()}
+        if stamps == self.source_stamps:
+            return
+        self.source_stamps = stamps
+        for name, data in self.load():
+            self.submit(name, data)
+
+    def submit(self, name, data):
+        """Record research for name; queue it unless it is what was queued last."""
+        fingerprint = self.fingerprint(data)
+        self.research[name] = (data, fingerprint)
+        if self.known.get(name) == fingerprint:
+            return False
+        self.known[name] = fingerprint
+        self.queue(name, data, fingerprint)
+        return True
+
+    def poll_targets(self):
+        """Reopen targets edited outside this process and requeue research."""
+        for i, target in enumerate(self.targets):
+            current = stamp(target.path)
+            if current == self.target_stamps[target.path]:
+                continue
+            print(f"\n{target.path} changed on disk; reloading.")
+            self.targets[i] = self.reopen(target.path)
+            self.target_stamps[target.path] = current
+            for name, (data, fingerprint) in self.research.items():
+                self.queue(name, data, fingerprint)
+
+    def queue(self, name, data, fingerprint):
+        now = time.monotonic()
+        self.pending[name] = (data, fingerprint)
+        if self.first_change is None:
+            self.first_change = now
+        self.last_change = now
+
+    def due(self):
+        if not self.pending:
+            return False
+        now = time.monotonic()
+        return (now - self.last_change >= self.debounce
+                or now - self.first_change >= self.max_wait)
+
+    def take(self):
+        """Hand over the pending companies as a new batch and start an empty one.
+
+        Returns (pending, research): the batch, plus a copy of all research
+        seen so far for targets that must be reloaded. Call it on the thread
+        that submits research; integrate() may run on another (serve mode),
+        and must not read self.research while that thread changes it.
+        """
+        pending, self.pending = self.pending, {}
+        self.first_change = self.last_change = None
+        self.batches += 1
+        return pending, dict(self.research)
+
+    def flush(self):
+        """Apply every pending company to every target and write once each."""
+        return self.integrate(*self.take())
+
+    def integrate(self, pending, research):
+        """Apply a batch taken with take() to every target; True if all commits succeed."""
+        print(f"\n-- batch {self.batches}: {len(pending)} companies queued")
+        ok = True
+        for i, target in enumerate(self.targets):
+            with integrate_lock.FileLock(target.path) as lock:
+                batch = pending
+                if stamp(target.path) != self.target_stamps[target.path]:
+                    # Written by another run since the last poll
+                    print(f"\n{target.path} changed on disk; reloading.")
+                    target = self.targets[i] = self.reopen(target.path)
+                    batch = {**research, **pending}
+                if len(self.targets) > 1:
+                    print(f"\n== {target.path}")
+                self.apply(target, batch)
+                committed = integrate_lock.commit_merged(lock, target, self.options)
+                if not committed and len(batch) > 1:
+                    # One bad company must not hold back the rest of the batch
+                    print(f"\nRetrying the {len(batch)} companies one at a time.")
+                    committed = True
+                    for name, entry in batch.items():
+                        self.apply(target, {name: entry})
+                        committed = target.commit() and committed
+                ok = committed and ok
+                self.target_stamps[target.path] = stamp(target.path)
+        if self.on_batch is not None:
+            self.on_batch(self.targets)
+        return ok
+
+    def apply(self, target, batch):
+        """Start a new batch on target with {name: (data, fingerprint)} applied."""
+        target.reset()
+        for name, (data, fingerprint) in batch.items():
+            try:
+                target.apply(name, data, fingerprint)
+            except (ValueError, TypeError, KeyError, AttributeError) as e:
+                # Only this company fails; the rest of the batch still lands
+                target.record("FAIL", name, f"cannot apply research: {e!r}")
+
+    def run(self, rounds=None):
+        """Poll until interrupted (or for `rounds` polls); returns True if all batches succeeded."""
+        ok = True
+        try:
+            while rounds is None or rounds > 0:
+                self.poll_targets()
+                self.poll_sources()
+                if self.due():
+                    ok = self.flush() and ok
+                if rounds is not None:
+                    rounds -= 1
+                time.sleep(self.interval)
+        except KeyboardInterrupt:
+            pass
+        if self.pending:
+            ok = self.flush() and ok
+        return ok
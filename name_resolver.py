@@ -0,0 +1,109 @@
+"""
+Resolves research company names to the names used in a target file.
+
+Research often names a company slightly differently from the page
+("Fenix Capital" vs "Fenix Capital Funding", "PROSPERUM" vs "Prosperum").
+NameResolver indexes a target's names once -- exact, normalized and by
+character trigram -- and then resolves each research entry in this order:
+
+  1. the exact name
+  2. any alias the research record lists
+  3. the normalized name (case, punctuation, legal suffixes ignored)
+  4. trigram similarity (with fuzzy=True), if the best candidate clears
+     the threshold and is clearly ahead of the runner-up
+"""
+
+import math
+import re
+import unicodedata
+from collections import defaultdict
+
+LEGAL_SUFFIXES = frozenset((
+    "inc", "llc", "l l c", "ltd", "lp", "llp", "co", "corp", "corporation",
+    "company", "the", "dba",
+))
+NON_WORD = re.compile(r"[^a-z0-9]+")
+
+# Trigram Dice score a fuzzy match needs, and how far it must lead the next one
+FUZZY_THRESHOLD = 0.6
+FUZZY_MARGIN = 0.1
+
+
+def normalize_name(name):
+    """Lowercase ASCII words with punctuation and legal suffixes dropped."""
+    name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    words = NON_WORD.sub(" ", name.lower().replace("&", " and ")).split()
+    kept = [w for w in words if w not in LEGAL_SUFFIXES]
+    return " ".join(kept or words)
+
+
+def trigrams(key):
+    """Character trigrams of a normalized name, padded at word edges."""
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameResolver:
+    """Index of a target's company names for alias and fuzzy lookup."""
+
+    __slots__ = ("names", "exact", "by_key", "grams", "postings", "fuzzy", "threshold")
+
+    def __init__(self, names, fuzzy=False, threshold=FUZZY_THRESHOLD):
+        self.names = list(dict.fromkeys(n for n in names if n))
+        self.exact = set(self.names)
+        self.fuzzy = fuzzy
+        self.threshold = threshold
+        self.by_key = {}
+        self.grams = []
+        self.postings = defaultdict(list)
+        for i, name in enumerate(self.names):
+            key = normalize_name(name)
+            self.by_key.setdefault(key, name)
+            grams = trigrams(key)
+            self.grams.append(grams)
+            for g in grams:
+                self.postings[g].append(i)
+
+    def resolve(self, name, aliases=()):
+        """Return (target_name, how) for a research name, or (None, None).
+
+        how is "exact", "alias", "normalized" or "fuzzy <score>".
+        """
+        if name in self.exact:
+            return name, "exact"
+        for alias in aliases:
+            if alias in self.exact:
+                return alias, "alias"
+        for candidate in (name, *aliases):
+            target = self.by_key.get(normalize_name(candidate))
+            if target is not None:
+                return target, "normalized"
+        if self.fuzzy:
+            return self._fuzzy(name)
+        return None, None
+
+    def _fuzzy(self, name):
+        grams = trigrams(normalize_name(name))
+        # Scores below floor cannot be the match nor block it as runner-up.
+        # Dice >= floor needs at least `need` shared trigrams, so every such
+        # candidate appears in one of the len(grams) - need + 1 rarest
+        # query trigrams (prefix filtering); common ones like " ca" are
+        # only used to score those candidates, never to find them.
+        floor = max(self.threshold - FUZZY_MARGIN, 0.01)
+        need = max(1, math.ceil(floor * len(grams) / (2 - floor)))
+        rare = sorted(grams, key=lambda g: len(self.postings.get(g, ())))
+        candidates = set()
+        for g in rare[:len(rare) - need + 1]:
+            candidates.update(self.postings.get(g, ()))
+        scored = sorted(
+            ((2 * len(grams & self.grams[i]) / (len(grams) + len(self.grams[i])), i)
+             for i in candidates),
+            reverse=True,
+        )
+        if not scored:
+            return None, None
+        best, i = scored[0]
+        runner_up = scored[1][0] if len(scored) > 1 else 0.0
+        if best < self.threshold or best - runner_up < FUZZY_MARGIN:
+            return None, None
+        return self.names[i], f"fuzzy {best:.2f}"
@@ -0,0 +1,246 @@
+"""
+Minified and precompressed copies of the integrated page.
+
+After a run, integrate_research.py --minify writes next to the page:
+
+  index.min.html       the CO array (and NEWS table) as compact literals,
+                       indentation, blank lines and whole-line script
+                       comments removed
+  index.min.html.gz    gzip -9
+  index.min.html.br    brotli, when the brotli module is installed
+
+With --split-co the data moves into index.co.js (plus .gz/.br), loaded by a
+plain <script src> ahead of the app code. The app keeps reading the CO
+global synchronously, and the data file can be cached on its own.
+
+With --shard-co the minified page keeps only the light fields of each
+company inline; news, icebreakers, leaders, tp and desc go into
+index.shards/<n>.json, a bucket of companies per file. A small loader
+wraps showDetail/showGlance so a company's bucket is fetched (once) the
+first time it is opened. index.html itself stays complete: it is the
+source the integrator edits.
+Line breaks are kept everywhere, so automatic semicolon insertion in the
+page's scripts is unaffected.
+"""
+
+import gzip
+import json
+import os
+
+try:
+    import brotli
+except ImportError:  # Optional: .br artifacts are skipped without it
+    brotli = None
+
+import co_model
+import integrate_io
+
+# Content inside these elements is whitespace-sensitive and copied as is
+VERBATIM_TAGS = ("pre", "textarea")
+WORD_TOKENS = frozenset(("ident", "num", "ref"))
+
+# Fields only the detail and glance views read, moved into shards
+HEAVY_FIELDS = ("news", "icebreakers", "leaders", "tp", "desc")
+SHARD_SIZE = 16
+
+# Runs right after the lite CO array, inside the app script, so the function
+# declarations it wraps are already hoisted. Cards index c.tp directly.
+SHARD_LOADER = """\
+const CO_SHARDS="{src}";
+(function(){
+var pending={};
+CO.forEach(function(c){c.tp=c.tp||[];});
+function withShard(fn){
+return function(id){
+var self=this,args=arguments;
+var c=CO.find(function(x){return x.id===id;});
+if(!c||c.shard===undefined)return fn.apply(self,args);
+var n=c.shard;
+if(!pending[n]){
+pending[n]=fetch(CO_SHARDS+n+".json").then(function(r){return r.json();}).then(function(rows){
+rows.forEach(function(row){
+var t=CO.find(function(x){return x.id===row.id;});
+if(t){Object.assign(t,row);delete t.shard;}
+});
+},function(){delete pending[n];});
+}
+pending[n].then(function(){fn.apply(self,args);});
+};
+}
+showDetail=withShard(showDetail);
+showGlance=withShard(showGlance);
+})();
+"""
+
+
+def compact_literal(text, start, end):
+    """Re-emit text[start:end] as JS tokens without whitespace or comments."""
+    out = []
+    prev_word = False
+    for m in co_model.TOKEN.finditer(text, start, end):
+        kind = m.lastgroup
+        if kind == "space" or kind == "comment":
+            continue
+        word = kind in WORD_TOKENS
+        if word and prev_word:
+            out.append(" ")
+        out.append(m.group())
+        prev_word = word
+    return "".join(out)
+
+
+def minify_markup(text, in_script=False):
+    """Strip indentation and blank lines, and // comment lines inside <script>.
+
+    in_script says whether text starts inside a script element.
+    """
+    out = []
+    verbatim = None
+    for line in text.split("\n"):
+        if verbatim is not None:
+            out.append(line)
+            if f"</{verbatim}" in line.lower():
+                verbatim = None
+            continue
+        stripped = line.strip()
+        lower = stripped.lower()
+        if "<script" in lower:
+            in_script = True
+        if "</script" in lower:
+            in_script = False
+        if not stripped or (in_script and stripped.startswith("//")):
+            continue
+        out.append(stripped)
+        for tag in VERBATIM_TAGS:
+            if f"<{tag}" in lower and f"</{tag}" not in lower:
+                verbatim = tag
+    return "".join(line + "\n" for line in out)
+
+
+def data_spans(text):
+    """Return [(name, line_start, bracket, line_end)] for the NEWS table and CO array.
+
+    Each span covers whole lines, from the `const` to the end of the line
+    holding the closing bracket.
+    """
+    decls = []
+    table = co_model.parse_news_table(text)
+    if table is not None:
+        decls.append(("NEWS", table.start + len(co_model.NEWS_TABLE_MARKER) - 1, table.end - 1))
+    doc = co_model.parse_co(text)
+    decls.append(("CO", doc.start, doc.end))
+    spans = []
+    for name, bracket, close in decls:
+        line_end = text.find("\n", close)
+        line_end = len(text) if line_end == -1 else line_end + 1
+        spans.append((name, text.rfind("\n", 0, bracket) + 1, bracket, line_end))
+    return spans
+
+
+def minify_page(text, split_src=None):
+    """Return (minified page, data script or None).
+
+    With split_src the NEWS/CO declarations are returned as a separate
+    script and the page loads it from split_src in their place.
+    """
+    page = []
+    data = []
+    pos = 0
+    for name, line_start, bracket, line_end in data_spans(text):
+        page.append(minify_markup(text[pos:line_start], in_script=pos > 0))
+        decl = f"const {name}=" + compact_literal(text, bracket, line_end) + "\n"
+        if split_src is None:
+            page.append(decl)
+        else:
+            if not data:
+                # Close the app script around the data and load it as its own file
+                page.append(f'</script>\n<script src="{split_src}"></script>\n<script>\n')
+            data.append(decl)
+        pos = line_end
+    page.append(minify_markup(text[pos:], in_script=True))
+    return "".join(page), ("".join(data) if split_src is not None else None)
+
+
+def shard_companies(text, shard_size=SHARD_SIZE):
+    """Split the page's companies into (lite CO literal, [bucket rows]).
+
+    Lite entries keep every light field plus `shard`, their bucket number;
+    bucket rows hold `id` and the heavy fields, in page order.
+    """
+    lite = []
+    shards = []
+    for i, company in enumerate(co_model.parse_co(text).companies):
+        values = company.to_dict()
+        n = i // shard_size
+        if n == len(shards):
+            shards.append([])
+        row = {"id": values.get("id")}
+        row.update((k, values.pop(k)) for k in HEAVY_FIELDS if k in values)
+        shards[n].append(row)
+        values["shard"] = n
+        lite.append(values)
+    return co_model.js_literal(lite), shards
+
+
+def shard_page(text, shards_src, shard_size=SHARD_SIZE):
+    """Return (minified page with the lite CO array and loader, [bucket rows])."""
+    lite, shards = shard_companies(text, shard_size)
+    page = []
+    pos = 0
+    for name, line_start, bracket, line_end in data_spans(text):
+        page.append(minify_markup(text[pos:line_start], in_script=pos > 0))
+        # NEWS references are resolved into the shards, so only CO remains
+        if name == "CO":
+            page.append(f"const CO={lite};\n" + SHARD_LOADER.replace("{src}", shards_src))
+        pos = line_end
+    page.append(minify_markup(text[pos:], in_script=True))
+    return "".join(page), shards
+
+
+def compressed_variants(data):
+    """Return [(suffix, bytes)] of precompressed encodings for data."""
+    variants = [(".gz", gzip.compress(data, 9, mtime=0))]
+    if brotli is not None:
+        variants.append((".br", brotli.compress(data, quality=11)))
+    return variants
+
+
+def write_compressed(path, content):
+    """Write content and its compressed siblings; returns [(path, size)]."""
+    raw = content.encode("utf-8")
+    written = []
+    for suffix, blob in [("", raw), *compressed_variants(raw)]:
+        integrate_io.atomic_write(path + suffix, blob)
+        written.append((path + suffix, len(blob)))
+    return written
+
+
+def write_artifacts(page_path, text, mode="minify", shard_size=SHARD_SIZE):
+    """Write the minified page, its data script or shards, and compressed siblings.
+
+    mode is "minify", "split" or "shard". Returns [(path, size)] of every
+    file written.
+    """
+    stem, ext = os.path.splitext(page_path)
+    min_path = stem + ".min" + ext
+    if mode == "shard":
+        shard_dir = stem + ".shards"
+        page, shards = shard_page(text, os.path.basename(shard_dir) + "/", shard_size)
+        written = write_compressed(min_path, page)
+        os.makedirs(shard_dir, exist_ok=True)
+        for n, rows in enumerate(shards):
+            written += write_compressed(os.path.join(shard_dir, f"{n}.json"),
+                                        json.dumps(rows, ensure_ascii=False, separators=(",", ":")))
+        # Buckets left over from a larger page would be served stale
+        current = {p for p, _ in written}
+        for name in os.listdir(shard_dir):
+            path = os.path.join(shard_dir, name)
+            if path not in current and name.split(".")[0].isdigit():
+                os.remove(path)
+        return written
+    data_path = stem + ".co.js"
+    page, data = minify_page(text, os.path.basename(data_path) if mode == "split" else None)
+    written = write_compressed(min_path, page)
+    if data is not None:
+        written += write_compressed(data_path, data)
+    return written
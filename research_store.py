@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+SQLite research store for integrate_research.py (--store).
+
+Research lives in one embedded database instead of being re-read from
+NDJSON and JSON files on every run:
+
+  companies    one row per research name: aliases, the fingerprint of the
+               news + icebreakers payload, and when it last changed
+  news         one row per item, in order, with the source and date split
+               out of "s" ("deBanked, Aug 2025" -> deBanked, 2025-08)
+  icebreakers  one row per icebreaker, in order
+
+companies.name is unique (and so indexed); news is indexed on date and on
+source. Queries are parameterized and drawn from a fixed set of
+statements, so sqlite3's statement cache prepares each one once per
+connection.
+
+upsert() writes a whole batch in one transaction. A company whose payload
+is unchanged is not rewritten, so its updated_at keeps meaning "research
+last changed". As in the files, a record without news or icebreakers
+leaves the stored ones alone.
+
+Run as a script to query the store:
+
+  python3 research_store.py research.db --source deBanked --since 2025-01
+"""
+
+import argparse
+import itertools
+import json
+import re
+import sqlite3
+import sys
+import time
+
+from co_index import research_fingerprint
+
+SCHEMA_VERSION = 1
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS companies (
+    id              INTEGER PRIMARY KEY,
+    name            TEXT NOT NULL UNIQUE,
+    aliases         TEXT NOT NULL DEFAULT '[]',
+    has_news        INTEGER NOT NULL DEFAULT 0,
+    has_icebreakers INTEGER NOT NULL DEFAULT 0,
+    fingerprint     TEXT,
+    updated_at      TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS news (
+    company_id  INTEGER NOT NULL REFERENCES companies(id) ON DELETE CASCADE,
+    position    INTEGER NOT NULL,
+    h           TEXT NOT NULL,
+    s           TEXT NOT NULL,
+    d           TEXT NOT NULL,
+    source      TEXT,
+    date        TEXT,
+    PRIMARY KEY (company_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS news_date ON news(date);
+CREATE INDEX IF NOT EXISTS news_source ON news(source);
+CREATE TABLE IF NOT EXISTS icebreakers (
+    company_id  INTEGER NOT NULL REFERENCES companies(id) ON DELETE CASCADE,
+    position    INTEGER NOT NULL,
+    text        TEXT NOT NULL,
+    PRIMARY KEY (company_id, position)
+) WITHOUT ROWID;
+"""
+
+SELECT_COMPANY = "SELECT id, aliases, has_news, has_icebreakers, fingerprint FROM companies WHERE name = ?"
+INSERT_COMPANY = ("INSERT INTO companies (name, aliases, has_news, has_icebreakers, fingerprint, updated_at) "
+                  "VALUES (?, ?, ?, ?, ?, ?)")
+UPDATE_COMPANY = ("UPDATE companies SET aliases = ?, has_news = ?, has_icebreakers = ?, fingerprint = ?, "
+                  "updated_at = ? WHERE id = ?")
+UPDATE_ALIASES = "UPDATE companies SET aliases = ? WHERE id = ?"
+DELETE_NEWS = "DELETE FROM news WHERE company_id = ?"
+INSERT_NEWS = "INSERT INTO news (company_id, position, h, s, d, source, date) VALUES (?, ?, ?, ?, ?, ?, ?)"
+DELETE_ICEBREAKERS = "DELETE FROM icebreakers WHERE company_id = ?"
+INSERT_ICEBREAKER = "INSERT INTO icebreakers (company_id, position, text) VALUES (?, ?, ?)"
+
+# Whole-store reads walk each table in company order and zip them together
+ALL_COMPANIES = ("SELECT id, name, aliases, has_news, has_icebreakers, updated_at FROM companies "
+                 "WHERE updated_at >= ? ORDER BY id")
+ALL_NEWS = "SELECT company_id, h, s, d FROM news ORDER BY company_id, position"
+ALL_ICEBREAKERS = "SELECT company_id, text FROM icebreakers ORDER BY company_id, position"
+
+# find_news() adds only the filters it is given, so SQLite can use their index
+FIND_NEWS = "SELECT c.name, n.h, n.s, n.d, n.source, n.date FROM news n JOIN companies c ON c.id = n.company_id"
+FIND_NEWS_FILTERS = (("n.source = ?", "source"), ("n.date >= ?", "since"), ("c.name = ?", "company"))
+FIND_NEWS_ORDER = " ORDER BY n.date DESC, c.name, n.position"
+
+MONTHS = {m: i for i, m in enumerate(
+    ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), 1)}
+MONTH_YEAR = re.compile(r"\b(" + "|".join(MONTHS) + r")[a-z]*\.?\s+((?:19|20)\d\d)\b", re.IGNORECASE)
+YEAR = re.compile(r"\b((?:19|20)\d\d)\b")
+
+
+def split_source(s):
+    """Split a news "s" field into (source, date).
+
+    The date is YYYY-MM or YYYY, the latest one mentioned, so it sorts;
+    None if there is none. "deBanked, Aug-Oct 2024" -> ("deBanked", "2024-10").
+    """
+    source, sep, when = s.rpartition(", ")
+    if not sep or not YEAR.search(when):
+        source, when = s, s
+    months = MONTH_YEAR.findall(when)
+    if months:
+        month, year = months[-1]
+        return source or None, f"{year}-{MONTHS[month[:3].lower()]:02d}"
+    years = YEAR.findall(when)
+    return source or None, (years[-1] if years else None)
+
+
+def _now():
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+class ResearchStore:
+    """A research database; use as a context manager or close() it."""
+
+    def __init__(self, path):
+        self.path = path
+        self.db = sqlite3.connect(path, isolation_level=None, cached_statements=64)
+        self.db.execute("PRAGMA foreign_keys = ON")
+        version = self.db.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            raise ValueError(f"{path}: research store schema {version} is newer than {SCHEMA_VERSION}")
+        if version < SCHEMA_VERSION:
+            self.db.executescript(SCHEMA)
+            self.db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def upsert(self, records):
+        """Store (name, data) research records in one transaction.
+
+        A later record for the same company replaces an earlier one, except
+        that missing news or icebreakers keep what is stored and aliases
+        accumulate. Returns (companies changed, companies unchanged).
+        """
+        changed = unchanged = 0
+        now = _now()
+        cur = self.db.cursor()
+        cur.execute("BEGIN IMMEDIATE")
+        try:
+            for name, data in records:
+                row = cur.execute(SELECT_COMPANY, (name,)).fetchone()
+                aliases = json.loads(row[1]) if row else []
+                aliases += [a for a in data.get("aliases") or () if a not in aliases]
+                aliases_json = json.dumps(aliases, ensure_ascii=False)
+                if row is not None:
+                    company_id, _, has_news, has_icebreakers, fingerprint = row
+                    # Keep the stored arrays the record does not carry
+                    if data["news"] is None or data["icebreakers"] is None:
+                        stored = self._payload(cur, company_id, has_news, has_icebreakers)
+                        data = {"news": stored["news"] if data["news"] is None else data["news"],
+                                "icebreakers": (stored["icebreakers"] if data["icebreakers"] is None
+                                                else data["icebreakers"])}
+                    if research_fingerprint(data) == fingerprint:
+                        if aliases_json != row[1]:
+                            cur.execute(UPDATE_ALIASES, (aliases_json, company_id))
+                        unchanged += 1
+                        continue
+                fields = (aliases_json, data["news"] is not None, data["icebreakers"] is not None,
+                          research_fingerprint(data), now)
+                if row is None:
+                    company_id = cur.execute(INSERT_COMPANY, (name,) + fields).lastrowid
+                else:
+                    cur.execute(UPDATE_COMPANY, fields + (company_id,))
+                    cur.execute(DELETE_NEWS, (company_id,))
+                    cur.execute(DELETE_ICEBREAKERS, (company_id,))
+                cur.executemany(INSERT_NEWS, (
+                    (company_id, i, item["h"], item["s"], item["d"], *split_source(item["s"]))
+                    for i, item in enumerate(data["news"] or ())))
+                cur.executemany(INSERT_ICEBREAKER, (
+                    (company_id, i, text) for i, text in enumerate(data["icebreakers"] or ())))
+                changed += 1
+            cur.execute("COMMIT")
+        except BaseException:
+            cur.execute("ROLLBACK")
+            raise
+        return changed, unchanged
+
+    def _payload(self, cur, company_id, has_news, has_icebreakers):
+        news = [{"h": h, "s": s, "d": d} for h, s, d in cur.execute(
+            "SELECT h, s, d FROM news WHERE company_id = ? ORDER BY position", (company_id,))]
+        icebreakers = [text for (text,) in cur.execute(
+            "SELECT text FROM icebreakers WHERE company_id = ? ORDER BY position", (company_id,))]
+        return {"news": news if has_news else None, "icebreakers": icebreakers if has_icebreakers else None}
+
+    def companies(self, updated_since=""):
+        """Yield (name, data) for every company, optionally only those changed since a timestamp.
+
+        data has the normalize_research() shape. Rows are streamed: three
+        ordered scans zipped by company id, never the whole store at once.
+        """
+        news = itertools.groupby(self.db.execute(ALL_NEWS), key=lambda r: r[0])
+        icebreakers = itertools.groupby(self.db.execute(ALL_ICEBREAKERS), key=lambda r: r[0])
+        next_news = next(news, (None, ()))
+        next_ib = next(icebreakers, (None, ()))
+        for company_id, name, aliases, has_news, has_icebreakers, _ in self.db.execute(
+                ALL_COMPANIES, (updated_since,)):
+            while next_news[0] is not None and next_news[0] < company_id:
+                next_news = next(news, (None, ()))
+            while next_ib[0] is not None and next_ib[0] < company_id:
+                next_ib = next(icebreakers, (None, ()))
+            items = [{"h": h, "s": s, "d": d} for _, h, s, d in next_news[1]] if next_news[0] == company_id else []
+            texts = [text for _, text in next_ib[1]] if next_ib[0] == company_id else []
+            yield name, {"news": items if has_news else None,
+                         "icebreakers": texts if has_icebreakers else None,
+                         "aliases": json.loads(aliases)}
+
+    def get(self, name):
+        """Return the stored data for one company, or None."""
+        row = self.db.execute(SELECT_COMPANY, (name,)).fetchone()
+        if row is None:
+            return None
+        data = self._payload(self.db.cursor(), row[0], row[2], row[3])
+        data["aliases"] = json.loads(row[1])
+        return data
+
+    def find_news(self, source=None, since=None, company=None):
+        """Yield (company, item, source, date), newest first, filtered by the indexed columns."""
+        given = {"source": source, "since": since, "company": company}
+        filters = [(sql, given[key]) for sql, key in FIND_NEWS_FILTERS if given[key] is not None]
+        query = FIND_NEWS + "".join((" AND " if i else " WHERE ") + sql for i, (sql, _) in enumerate(filters))
+        rows = self.db.execute(query + FIND_NEWS_ORDER, [value for _, value in filters])
+        for name, h, s, d, src, date in rows:
+            yield name, {"h": h, "s": s, "d": d}, src, date
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the research store.")
+    parser.add_argument("db", help="research store (SQLite)")
+    parser.add_argument("--source", help="only news from this source, e.g. deBanked")
+    parser.add_argument("--since", metavar="YYYY[-MM]", help="only news dated this month or later")
+    parser.add_argument("--company", help="only this company's news")
+    args = parser.parse_args(argv)
+    with ResearchStore(args.db) as store:
+        for name, item, source, date in store.find_news(args.source, args.since, args.company):
+            print(json.dumps({"name": name, **item, "source": source, "date": date}, ensure_ascii=False))
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)